@@ -4,6 +4,8 @@ Code Review Agent
 Automated PR analysis and security scanning.
 """
 
+import asyncio
+
 from bedrock_agentcore import BedrockAgentCoreApp
 from strands import Agent, tool
 
@@ -58,6 +60,14 @@ def suggest_improvements(code: str) -> list:
     
     return suggestions
 
+async def review_all(code: str) -> list:
+    """Run all static checks concurrently"""
+    return await asyncio.gather(
+        asyncio.to_thread(check_security_issues, code),
+        asyncio.to_thread(check_code_quality, code),
+        asyncio.to_thread(suggest_improvements, code),
+    )
+
 @app.entrypoint
 def invoke(payload):
     """
@@ -82,6 +92,12 @@ if __name__ == "__main__":
     print(f"\nCode to Review:\n{SAMPLE_CODE}")
     print("-" * 60)
     
+    security, quality, suggestions = asyncio.run(review_all(SAMPLE_CODE))
+    print("\nStatic Checks:")
+    for finding in security + quality + suggestions:
+        print(f"  - {finding}")
+    print("-" * 60)
+    
     response = invoke({"code": SAMPLE_CODE})
     print(f"\nReview:\n{response['review']}")
     print("=" * 60)
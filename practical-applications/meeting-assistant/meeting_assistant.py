@@ -4,12 +4,18 @@ Meeting Assistant
 Transcription processing and action items.
 """
 
+import asyncio
+import re
+
 from bedrock_agentcore import BedrockAgentCoreApp
 from strands import Agent, tool
 from datetime import datetime
 
 app = BedrockAgentCoreApp()
 
+# Most agent runs batch_invoke has in flight at once
+BATCH_CONCURRENCY = 4
+
 TRANSCRIPT = """
 Alice: Let's discuss the Q1 roadmap. We need to launch the new feature by March 15th.
 Bob: Agreed. I'll handle the backend API. Can someone take the frontend?
@@ -18,27 +24,20 @@ Alice: Yes, I'll review by Friday. Bob, please send the API specs by Wednesday.
 Bob: Will do. We should also schedule a demo for stakeholders.
 """
 
+# Single-pass scanners over the raw transcript
+_ACTION_RE = re.compile(r"^.*(?:will|can you|please|should|need to).*$", re.IGNORECASE | re.MULTILINE)
+_SPEAKER_RE = re.compile(r"^([^:\n]+):", re.MULTILINE)
+
 @tool
 def extract_action_items(transcript: str) -> list:
     """Extract action items from transcript"""
-    actions = []
-    
-    keywords = ["will", "can you", "please", "should", "need to"]
-    for line in transcript.split("\n"):
-        if any(kw in line.lower() for kw in keywords):
-            actions.append(line.strip())
-    
-    return actions
+    return [m.group(0).strip() for m in _ACTION_RE.finditer(transcript)]
 
 @tool
 def identify_participants(transcript: str) -> list:
     """Identify meeting participants"""
-    participants = set()
-    for line in transcript.split("\n"):
-        if ":" in line:
-            name = line.split(":")[0].strip()
-            if name:
-                participants.add(name)
+    participants = {m.group(1).strip() for m in _SPEAKER_RE.finditer(transcript)}
+    participants.discard("")
     
     return list(participants)
 
@@ -47,15 +46,11 @@ def summarize_meeting(transcript: str) -> str:
     """Generate meeting summary"""
     return "Discussed Q1 roadmap. Key deadline: March 15th feature launch. Tasks assigned to team members."
 
-@app.entrypoint
-def invoke(payload):
-    """
-    Meeting assistant agent.
-    """
+def _run_agent(payload, **agent_kwargs):
     transcript = payload.get("transcript", TRANSCRIPT)
     query = payload.get("prompt")
     
-    agent = Agent()
+    agent = Agent(**agent_kwargs)
     agent.add_tool(extract_action_items)
     agent.add_tool(identify_participants)
     agent.add_tool(summarize_meeting)
@@ -65,6 +60,30 @@ def invoke(payload):
     
     return {"answer": result.message}
 
+@app.entrypoint
+def invoke(payload):
+    """
+    Meeting assistant agent.
+    """
+    return _run_agent(payload)
+
+def batch_invoke(payloads: list) -> list:
+    """
+    Invoke the agent for several payloads concurrently, preserving order.
+    At most BATCH_CONCURRENCY run at once, and they don't stream to stdout,
+    where their output would interleave.
+    """
+    async def _run_all():
+        semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+        
+        async def _run_one(payload):
+            async with semaphore:
+                return await asyncio.to_thread(_run_agent, payload, callback_handler=None)
+        
+        return await asyncio.gather(*(_run_one(payload) for payload in payloads))
+    
+    return asyncio.run(_run_all())
+
 if __name__ == "__main__":
     print("Meeting Assistant Demo")
     print("=" * 60)
@@ -76,9 +95,10 @@ if __name__ == "__main__":
         "What are the key deadlines?"
     ]
     
-    for query in queries:
+    responses = batch_invoke([{"prompt": query} for query in queries])
+    
+    for query, response in zip(queries, responses):
         print(f"\nQuery: {query}")
-        response = invoke({"prompt": query})
         print(f"Answer: {response['answer']}")
         print("-" * 60)
     
@@ -4,11 +4,17 @@ Research Assistant
 Web search, synthesis, and citation management.
 """
 
+import asyncio
+import re
+
 from bedrock_agentcore import BedrockAgentCoreApp
 from strands import Agent, tool
 
 app = BedrockAgentCoreApp()
 
+# Most agent runs batch_invoke has in flight at once
+BATCH_CONCURRENCY = 4
+
 # Simulated search results
 SEARCH_DB = {
     "AI": [
@@ -21,14 +27,16 @@ SEARCH_DB = {
     ]
 }
 
+# Lowercased lookup index over SEARCH_DB, built once at import
+_LOWER_KEYS = {key.lower(): results for key, results in SEARCH_DB.items()}
+_KEYS_RE = re.compile("|".join(re.escape(key) for key in _LOWER_KEYS))
+
 @tool
 def web_search(query: str, max_results: int = 3) -> list:
     """Search the web for information"""
-    query_lower = query.lower()
-    
-    for key in SEARCH_DB:
-        if key.lower() in query_lower:
-            return SEARCH_DB[key][:max_results]
+    match = _KEYS_RE.search(query.lower())
+    if match:
+        return _LOWER_KEYS[match.group(0)][:max_results]
     
     return []
 
@@ -47,14 +55,10 @@ def generate_citations(sources: list) -> list:
         citations.append(f"[{i}] {source['title']} - {source['url']}")
     return citations
 
-@app.entrypoint
-def invoke(payload):
-    """
-    Research assistant agent.
-    """
+def _run_agent(payload, **agent_kwargs):
     query = payload.get("prompt")
     
-    agent = Agent()
+    agent = Agent(**agent_kwargs)
     agent.add_tool(web_search)
     agent.add_tool(synthesize_sources)
     agent.add_tool(generate_citations)
@@ -63,6 +67,30 @@ def invoke(payload):
     
     return {"answer": result.message}
 
+@app.entrypoint
+def invoke(payload):
+    """
+    Research assistant agent.
+    """
+    return _run_agent(payload)
+
+def batch_invoke(payloads: list) -> list:
+    """
+    Invoke the agent for several payloads concurrently, preserving order.
+    At most BATCH_CONCURRENCY run at once, and they don't stream to stdout,
+    where their output would interleave.
+    """
+    async def _run_all():
+        semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+        
+        async def _run_one(payload):
+            async with semaphore:
+                return await asyncio.to_thread(_run_agent, payload, callback_handler=None)
+        
+        return await asyncio.gather(*(_run_one(payload) for payload in payloads))
+    
+    return asyncio.run(_run_all())
+
 if __name__ == "__main__":
     print("Research Assistant Demo")
     print("=" * 60)
@@ -73,9 +101,10 @@ if __name__ == "__main__":
         "Research machine learning applications"
     ]
     
-    for query in queries:
+    responses = batch_invoke([{"prompt": query} for query in queries])
+    
+    for query, response in zip(queries, responses):
         print(f"\nQuery: {query}")
-        response = invoke({"prompt": query})
         print(f"Answer: {response['answer']}")
         print("-" * 60)
     
@@ -3,11 +3,32 @@ import boto3
 import subprocess
 import json
 import time
+import hashlib
+import asyncio
+import base64
 import os
+import shutil
+import tempfile
+import threading
 import requests
-from kubernetes import client, config
-from kubernetes.client.rest import ApiException
-from strands_eks_agent import StrandsEKSAgent
+import pandas as pd
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from botocore.config import Config
+from botocore.signers import RequestSigner
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+from strands_eks_agent import DESCRIBE_CONCURRENCY
+
+try:
+    import aioboto3
+except ImportError:
+    aioboto3 = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Page configuration
 st.set_page_config(
@@ -16,10 +37,238 @@ st.set_page_config(
     layout="wide"
 )
 
-# Early AWS credential check - show warning banner if not configured
-@st.cache_resource
-def get_aws_integration():
-    return AWSEKSIntegration()
+# Static help text and command snippets, built once at import rather than on every rerun
+_CREDENTIALS_HELP_MD = """
+**Get your AWS credentials:**
+1. Go to [AWS Console](https://console.aws.amazon.com/)
+2. Navigate to **IAM** → **Users**
+3. Create user with **AdministratorAccess**
+4. Create **Access Keys**
+"""
+
+_SIDEBAR_CLI_HINT_MD = """
+**Configure credentials above ☝️**
+
+Or use AWS CLI:
+```bash
+aws configure
+```
+"""
+
+_SETUP_MD = """
+1. **Install AWS CLI** (if not already installed):
+   ```bash
+   pip install awscli
+   ```
+
+2. **Configure your credentials**:
+   ```bash
+   aws configure
+   ```
+
+3. **Enter your AWS details**:
+   - **AWS Access Key ID**: Your access key
+   - **AWS Secret Access Key**: Your secret key  
+   - **Default region**: us-west-2 (or your preferred region)
+   - **Default output format**: json
+
+4. **Verify connection**:
+   ```bash
+   aws sts get-caller-identity
+   ```
+
+### 🔑 Where to get AWS credentials:
+- Go to [AWS Console](https://console.aws.amazon.com/)
+- Navigate to **IAM** → **Users** → **Your User** → **Security credentials**
+- Click **Create access key**
+
+### 🛡️ Required permissions:
+Your AWS user needs permissions for:
+- EKS (Elastic Kubernetes Service)
+- EC2 (for worker nodes)
+- ECR (Elastic Container Registry)
+- IAM (for cluster roles)
+"""
+
+_MONITOR_SETUP_MD = """
+### To use the cluster monitor, you need AWS credentials configured.
+
+**Quick setup:**
+```bash
+aws configure
+```
+
+Then refresh this page to connect to your EKS clusters.
+"""
+
+_EKSCTL_CREATE_TMPL = """\
+eksctl create cluster \\
+  --name {cluster_name} \\
+  --region {region} \\
+  --nodegroup-name default-nodes \\
+  --node-type t3.medium \\
+  --nodes 2 \\
+  --nodes-min 1 \\
+  --nodes-max 4 \\
+  --managed
+"""
+
+_YAML_SQLSERVER = """\
+apiVersion: apps/v1
+kind: Deployment
+metadata:
+  name: sqlserver
+  namespace: dotnet-app
+spec:
+  replicas: 1
+  selector:
+    matchLabels:
+      app: sqlserver
+  template:
+    spec:
+      containers:
+      - name: sqlserver
+        image: mcr.microsoft.com/mssql/server:2022-latest
+        resources:
+          requests:
+            memory: "2Gi"
+            cpu: "1000m"
+"""
+
+_KUBECTL_DEPLOY_TMPL = """\
+kubectl create deployment dotnet-app \\
+  --image=mcr.microsoft.com/dotnet/samples:aspnetapp \\
+  --replicas=2 \\
+  --namespace={namespace}
+
+kubectl expose deployment dotnet-app \\
+  --type=LoadBalancer \\
+  --port=80 \\
+  --target-port=8080 \\
+  --namespace={namespace}
+"""
+
+# Post-deployment guide, shown after a successful deployment
+_KIRO_STEPS_MD = """
+### 🔧 **Step 1: Configure EKS MCP in Kiro**
+
+1. **Download MCP config** from the "🔧 MCP Configuration" page
+2. **Place in Kiro**: `.kiro/settings/mcp.json`
+3. **Restart Kiro** or reload MCP servers
+
+### 💬 **Step 2: Chat with EKS MCP Server**
+
+In Kiro chat, you can now use these **exact natural language commands**:
+"""
+
+_KIRO_RESULT_MD = """
+### 🎉 **Result in Kiro**
+
+Kiro will execute these commands and show you:
+- ✅ **Real-time progress** of cluster creation
+- ✅ **Live deployment status** 
+- ✅ **Actual service endpoints**
+- ✅ **Error troubleshooting** if issues occur
+
+**This Streamlit demo shows you what happens behind the scenes!**
+"""
+
+_AWS_CONSOLE_MD_TMPL = """
+**Check your AWS Console to see the real resources:**
+
+🔗 [Open EKS Console](https://{region}.console.aws.amazon.com/eks/home?region={region}#/clusters)
+
+You should see:
+- **EKS Cluster**: `{cluster_name}`
+- **Node Groups**: Running EC2 instances  
+- **Workloads**: Deployed applications
+"""
+
+_KUBECTL_VERIFY_TMPL = """\
+# Connect to your cluster
+aws eks update-kubeconfig --region {region} --name {cluster_name}
+
+# Check cluster nodes
+kubectl get nodes
+
+# Check your application
+kubectl get pods -n dotnet-app
+kubectl get services -n dotnet-app
+
+# Get LoadBalancer URL
+kubectl get service dotnet-app-service -n dotnet-app -o wide
+"""
+
+# EKS MCP server tools offered for auto-approval
+_MCP_TOOLS = (
+    "list_clusters",
+    "describe_cluster",
+    "list_pods",
+    "get_pod_logs",
+    "list_services",
+    "list_deployments",
+    "get_events",
+    "describe_nodes"
+)
+
+# Example Commands page content
+_EXAMPLE_COMMANDS = {
+    "🏗️ Cluster Management": [
+        "Create a new EKS cluster named 'my-cluster' in us-west-2 region",
+        "Show me all EKS clusters and their status",
+        "Delete the cluster named 'old-cluster'",
+        "What's the status of my production-cluster?",
+        "Show me the VPC configuration for my staging cluster",
+        "Update my cluster to Kubernetes version 1.31"
+    ],
+    
+    "🚀 Application Deployment": [
+        "Deploy my .NET Core app to the production namespace with 3 replicas",
+        "Create a deployment from my ECR image with LoadBalancer service",
+        "Deploy SQL Server to the database namespace with persistent storage",
+        "Update my webapi deployment with the new image tag v2.0",
+        "Scale the frontend deployment to 5 replicas",
+        "Create a namespace called 'dotnet-app'"
+    ],
+    
+    "📊 Monitoring & Troubleshooting": [
+        "Show me all pods in the production namespace and their status",
+        "Get the logs from the api-server pod in the last 30 minutes",
+        "Why is my nginx-ingress-controller pod failing to start?",
+        "Show me events in the staging namespace for the last hour",
+        "List all services and their endpoints in the default namespace",
+        "Check the health of all nodes in my cluster"
+    ]
+}
+
+# Streamlit caches are shared by every session on the server, so the cached
+# integration is keyed on the credentials it was built with. Caches keyed on
+# credentials are capped so pairs entered once (typos included) get evicted.
+_CREDENTIAL_CACHE_ENTRIES = 16
+
+@st.cache_resource(show_spinner=False, max_entries=_CREDENTIAL_CACHE_ENTRIES)
+def _cached_integration(region, access_key=None, secret_key=None):
+    return AWSEKSIntegration(region, access_key, secret_key)
+
+# One Strands agent per integration, sharing its pooled EKS client
+@st.cache_resource(show_spinner=False, max_entries=_CREDENTIAL_CACHE_ENTRIES)
+def _cached_strands_agent(region, access_key=None, secret_key=None):
+    from strands_eks_agent import StrandsEKSAgent
+    
+    aws = _cached_integration(region, access_key, secret_key)
+    agent = StrandsEKSAgent(region, access_key, secret_key, eks_client=aws.eks_client)
+    # The warmup call retries with the shared client's adaptive policy, so
+    # keep it off the render path in case the endpoint is unreachable
+    threading.Thread(target=agent.warmup, daemon=True).start()
+    return agent
+
+def get_aws_integration(region=None):
+    """Return the AWS integration for the current session's credentials and region"""
+    return _cached_integration(
+        region or st.session_state.get('aws_region', 'us-west-2'),
+        st.session_state.get('aws_access_key'),
+        st.session_state.get('aws_secret_key')
+    )
 
 # Quick credential check for banner
 def check_credentials_configured():
@@ -30,16 +279,11 @@ def check_credentials_configured():
     
     # Fall back to AWS CLI check
     try:
-        temp_aws = AWSEKSIntegration()
-        creds_check, _ = temp_aws.check_aws_credentials()
+        creds_check, _ = get_aws_integration().check_aws_credentials()
         return creds_check
     except:
         return False
 
-# Show credential warning if not configured
-if not check_credentials_configured():
-    st.error("🚨 **AWS Credentials Required!** Configure them in the sidebar or use `aws configure`.")
-
 def configure_aws_credentials():
     """Show AWS credential configuration form in sidebar"""
     st.sidebar.markdown("---")
@@ -57,13 +301,7 @@ def configure_aws_credentials():
     
     # Show configuration form
     with st.sidebar.form("aws_credentials"):
-        st.markdown("""
-        **Get your AWS credentials:**
-        1. Go to [AWS Console](https://console.aws.amazon.com/)
-        2. Navigate to **IAM** → **Users**
-        3. Create user with **AdministratorAccess**
-        4. Create **Access Keys**
-        """)
+        st.markdown(_CREDENTIALS_HELP_MD)
         
         access_key = st.text_input("AWS Access Key ID", 
             placeholder="AKIA...", 
@@ -105,71 +343,366 @@ def configure_aws_credentials():
     
     return False
 
+# Adaptive retries back off client-side when EKS starts throttling. The pool
+# holds a kept-alive connection for every describe DESCRIBE_CONCURRENCY allows
+# in flight, plus as many again for other calls from concurrent reruns.
+_CLIENT_CONFIG = Config(
+    retries={'mode': 'adaptive', 'max_attempts': 10},
+    max_pool_connections=2 * DESCRIBE_CONCURRENCY,
+    tcp_keepalive=True
+)
+
+# boto3 clients are expensive to build (service model loading), so keep one
+# set per (region, credentials) alive across Streamlit reruns
+@st.cache_resource(max_entries=_CREDENTIAL_CACHE_ENTRIES)
+def _make_clients(region, access_key=None, secret_key=None):
+    session_kwargs = {'region_name': region}
+    if access_key and secret_key:
+        session_kwargs.update(aws_access_key_id=access_key, aws_secret_access_key=secret_key)
+    session = boto3.session.Session(**session_kwargs)
+    clients = {name: session.client(name, config=_CLIENT_CONFIG) for name in ('eks', 'ec2', 'ecr', 'sts')}
+    clients['session'] = session
+    return clients
+
+def _credential_fingerprint(access_key, secret_key):
+    """Cache key for a credential pair that keeps the raw secret out of cache indexes"""
+    if not access_key:
+        return 'default'
+    return hashlib.sha256(f"{access_key}:{secret_key}".encode()).hexdigest()
+
+# Short-lived caches for AWS read calls. Errors raise instead of returning,
+# so failed lookups are never cached.
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_caller_identity(_sts_client, region, credentials_key):
+    return _sts_client.get_caller_identity()
+
+def _cluster_summary(cluster):
+    """Reduce a DescribeCluster payload to the fields the UI shows"""
+    return {
+        'name': cluster['name'],
+        'status': cluster['status'],
+        'version': cluster['version'],
+        'endpoint': cluster['endpoint'],
+        'created': cluster['createdAt']
+    }
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_cluster_names(_aws, region, credentials_key):
+    return _aws._fetch_cluster_names()
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_describe(_aws, cluster_name, region, credentials_key):
+    cluster = _aws.eks_client.describe_cluster(name=cluster_name)['cluster']
+    return _cluster_summary(cluster)
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_list_clusters(_aws, region, credentials_key):
+    if aioboto3 is not None:
+        described = asyncio.run(_aws._alist_clusters())
+    else:
+        described = _aws._describe_clusters_threaded()
+    
+    # Keyed by name (in listing order) so pages can look a cluster up directly
+    return {cluster['name']: _cluster_summary(cluster) for cluster in described}
+
+def _json_loads(data):
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+def _json_dumps_pretty(obj):
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+def _parse_k8s_timestamp(value):
+    """Parse a Kubernetes RFC 3339 timestamp such as 2024-01-31T12:00:00Z"""
+    return datetime.strptime(value, '%Y-%m-%dT%H:%M:%SZ').replace(tzinfo=timezone.utc)
+
+def _pod_summary(pod):
+    """Summarize a pod from its raw API JSON"""
+    pod_status = pod.get('status', {})
+    
+    # Single pass over container statuses for ready and restart counts
+    ready = 0
+    restarts = 0
+    for status in pod_status.get('containerStatuses') or ():
+        ready += status.get('ready', False)
+        restarts += status.get('restartCount', 0)
+    
+    return {
+        'name': pod['metadata']['name'],
+        'status': pod_status.get('phase'),
+        'ready': ready,
+        'total': len(pod['spec']['containers']),
+        'restarts': restarts,
+        'age': _parse_k8s_timestamp(pod['metadata']['creationTimestamp'])
+    }
+
+# A pod watch whose page hasn't rendered for this long belongs to a closed or
+# navigated-away browser session; the live view reruns every 2 seconds
+_POD_WATCH_IDLE_SECONDS = 30
+
+def _sync_pods(v1, namespace, pod_watch, timeout=60):
+    """Keep pod_watch['pods'] in step with a namespace until pod_watch['stop'] is set
+
+    Lists once, then applies watch events from the list's resourceVersion; the
+    list is redone whenever a watch ends or fails. Also exits once the page
+    stops stamping pod_watch['seen']. Runs on a background thread, so it must
+    not call into Streamlit.
+    """
+    from kubernetes import watch
+    
+    pods = pod_watch['pods']
+    stop = pod_watch['stop']
+    
+    def abandoned():
+        return time.time() - pod_watch['seen'] > _POD_WATCH_IDLE_SECONDS
+    
+    while not stop.is_set() and not abandoned():
+        try:
+            response = v1.list_namespaced_pod(namespace=namespace, _preload_content=False)
+            listing = _json_loads(response.data)
+            current = {pod['metadata']['name']: _pod_summary(pod) for pod in listing['items']}
+            for name in pods.keys() - current.keys():
+                pods.pop(name, None)
+            pods.update(current)
+            pod_watch['synced'] = True
+            pod_watch['error'] = None
+            
+            pod_events = watch.Watch()
+            for event in pod_events.stream(
+                v1.list_namespaced_pod,
+                namespace=namespace,
+                resource_version=listing['metadata']['resourceVersion'],
+                timeout_seconds=timeout
+            ):
+                if stop.is_set() or abandoned():
+                    pod_events.stop()
+                    break
+                
+                pod = event['raw_object']
+                if event['type'] == 'DELETED':
+                    pods.pop(pod['metadata']['name'], None)
+                elif event['type'] in ('ADDED', 'MODIFIED'):
+                    pods[pod['metadata']['name']] = _pod_summary(pod)
+        except Exception as e:
+            # Includes expired resourceVersions; back off, then re-list
+            pod_watch['error'] = str(e)
+            stop.wait(5)
+
+# EKS bearer tokens are valid for 15 minutes; refresh well before that
+_EKS_TOKEN_TTL_SECONDS = 600
+
+# Kubernetes clients per cluster. The configuration behind them pulls a fresh
+# bearer token through its refresh hook, so the clients outlive any one token.
+# They are still rebuilt hourly (or on "Refresh AWS Data") so a cluster
+# recreated under the same name picks up its new endpoint and CA.
+@st.cache_resource(ttl=3600, show_spinner=False)
+def _k8s_clients(_aws, cluster_name, region, credentials_key):
+    from kubernetes import client
+    
+    success, configuration = _aws.get_cluster_configuration(cluster_name)
+    if not success:
+        raise RuntimeError(configuration)
+    
+    # A dedicated ApiClient keeps each cluster's connection pool separate from
+    # the process-wide default configuration
+    api_client = client.ApiClient(configuration)
+    return client.CoreV1Api(api_client), client.AppsV1Api(api_client)
+
+# GitHub API access for the project analyzer: one keep-alive session per
+# process, with a token from the environment or st.secrets (Streamlit exports
+# root-level secrets as environment variables) to lift the 60/hour limit
+@st.cache_resource
+def _gh_session():
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(pool_maxsize=10))
+    session.headers.update({
+        'Accept': 'application/vnd.github+json',
+        'Accept-Encoding': 'gzip',
+        'User-Agent': 'eks-demo'
+    })
+    token = os.environ.get('GITHUB_TOKEN')
+    if token:
+        session.headers['Authorization'] = f'Bearer {token}'
+    # url -> (etag, payload) for conditional requests; 304s don't count
+    # against the rate limit
+    session.etags = {}
+    return session
+
+def _gh_get_json(session, url):
+    """GET a GitHub API URL, revalidating any previous response by ETag"""
+    cached = session.etags.get(url)
+    headers = {'If-None-Match': cached[0]} if cached else None
+    response = session.get(url, headers=headers, timeout=(3, 10))
+    if response.status_code == 304:
+        return cached[1]
+    
+    response.raise_for_status()
+    payload = response.json()
+    if response.headers.get('ETag'):
+        session.etags[url] = (response.headers['ETag'], payload)
+    return payload
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _gh_repo_snapshot(owner, repo):
+    """Fetch repo metadata and top-level contents concurrently"""
+    session = _gh_session()
+    api_url = f"https://api.github.com/repos/{owner}/{repo}"
+    
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        repo_future = executor.submit(_gh_get_json, session, api_url)
+        contents_future = executor.submit(_gh_get_json, session, f"{api_url}/contents")
+        
+        # Raising keeps missing/inaccessible repos, and rate-limited or timed
+        # out contents fetches, out of the cache. Only an empty repo (404 on
+        # its contents) is a real "no files" answer.
+        repo_info = repo_future.result()
+        try:
+            files = contents_future.result()
+        except requests.HTTPError as e:
+            if e.response is None or e.response.status_code != 404:
+                raise
+            files = None
+    
+    return repo_info, files
+
+# Repository analysis only depends on the repo, so repeated deploys of the
+# same URL are served from cache; failures raise and are never cached
+@st.cache_data(ttl=3600, show_spinner=False)
+def _analyze_repo(owner, repo):
+    """Detect .NET project files in a GitHub repository"""
+    # Fetch repo metadata and top-level contents via GitHub API
+    repo_info, files = _gh_repo_snapshot(owner, repo)
+    
+    analysis = {
+        "framework": "net8.0",
+        "project_type": "Web API",
+        "has_dockerfile": False,
+        "dependencies": [],
+        "endpoints": [],
+        "repo_info": repo_info
+    }
+    
+    if isinstance(files, list):
+        file_names = [f['name'] for f in files]
+        
+        # Check for .NET project files
+        if any(f.endswith('.csproj') for f in file_names):
+            analysis["has_csproj"] = True
+        
+        # Check for Dockerfile
+        if any('Dockerfile' in f for f in file_names):
+            analysis["has_dockerfile"] = True
+        
+        # Check for common .NET files
+        if 'Program.cs' in file_names:
+            analysis["has_program_cs"] = True
+    
+    return analysis
+
+# Locate eksctl once per process rather than spawning `eksctl version`
+@st.cache_resource
+def _eksctl_path():
+    return shutil.which('eksctl')
+
 # AWS Integration Class
 class AWSEKSIntegration:
     def __init__(self, region='us-west-2', access_key=None, secret_key=None):
         self.region = region
         
         # Use provided credentials or fall back to default AWS config
-        if access_key and secret_key:
-            self.eks_client = boto3.client('eks', 
-                region_name=region,
-                aws_access_key_id=access_key,
-                aws_secret_access_key=secret_key)
-            self.ec2_client = boto3.client('ec2', 
-                region_name=region,
-                aws_access_key_id=access_key,
-                aws_secret_access_key=secret_key)
-            self.ecr_client = boto3.client('ecr', 
-                region_name=region,
-                aws_access_key_id=access_key,
-                aws_secret_access_key=secret_key)
-            self.sts_client = boto3.client('sts', 
-                region_name=region,
-                aws_access_key_id=access_key,
-                aws_secret_access_key=secret_key)
-        else:
-            self.eks_client = boto3.client('eks', region_name=region)
-            self.ec2_client = boto3.client('ec2', region_name=region)
-            self.ecr_client = boto3.client('ecr', region_name=region)
-            self.sts_client = boto3.client('sts', region_name=region)
+        if not (access_key and secret_key):
+            access_key = secret_key = None
+        
+        self.credentials_key = _credential_fingerprint(access_key, secret_key)
+        clients = _make_clients(region, access_key, secret_key)
+        self.session = clients['session']
+        self.eks_client, self.ec2_client, self.ecr_client, self.sts_client = (
+            clients[name] for name in ('eks', 'ec2', 'ecr', 'sts')
+        )
         
     def check_aws_credentials(self):
         """Check if AWS credentials are configured"""
         try:
-            identity = self.sts_client.get_caller_identity()
+            identity = _cached_caller_identity(self.sts_client, self.region, self.credentials_key)
             return True, identity
         except Exception as e:
             return False, str(e)
     
-    def list_clusters(self):
-        """List all EKS clusters in the region"""
+    def list_clusters_by_name(self):
+        """List all EKS clusters in the region as a {name: summary} dict"""
         try:
-            response = self.eks_client.list_clusters()
-            clusters = []
-            
-            for cluster_name in response['clusters']:
-                cluster_info = self.eks_client.describe_cluster(name=cluster_name)
-                clusters.append({
-                    'name': cluster_name,
-                    'status': cluster_info['cluster']['status'],
-                    'version': cluster_info['cluster']['version'],
-                    'endpoint': cluster_info['cluster']['endpoint'],
-                    'created': cluster_info['cluster']['createdAt']
-                })
-            
-            return True, clusters
+            return True, _cached_list_clusters(self, self.region, self.credentials_key)
+        except Exception as e:
+            return False, str(e)
+    
+    def list_cluster_names(self):
+        """List EKS cluster names in the region without describing each one"""
+        try:
+            cluster_names = _cached_cluster_names(self, self.region, self.credentials_key)
+            return True, cluster_names
+        except Exception as e:
+            return False, str(e)
+    
+    def describe_cluster(self, cluster_name):
+        """Describe a single EKS cluster"""
+        try:
+            return True, _cached_describe(self, cluster_name, self.region, self.credentials_key)
         except Exception as e:
             return False, str(e)
     
+    def _fetch_cluster_names(self):
+        """Collect cluster names across every ListClusters page"""
+        paginator = self.eks_client.get_paginator('list_clusters')
+        return [name for page in paginator.paginate() for name in page['clusters']]
+    
+    def _describe_clusters_threaded(self):
+        """Describe every cluster in the region using a bounded thread pool"""
+        cluster_names = self._fetch_cluster_names()
+        if not cluster_names:
+            return []
+        
+        # boto3 clients are thread-safe; the worker cap keeps us clear of
+        # EKS API throttling
+        with ThreadPoolExecutor(max_workers=min(DESCRIBE_CONCURRENCY, len(cluster_names))) as executor:
+            return list(executor.map(
+                lambda name: self.eks_client.describe_cluster(name=name)['cluster'],
+                cluster_names
+            ))
+    
+    async def _alist_clusters(self):
+        """Describe every cluster in the region concurrently with aioboto3"""
+        credentials = self.session.get_credentials().get_frozen_credentials()
+        session = aioboto3.Session(
+            aws_access_key_id=credentials.access_key,
+            aws_secret_access_key=credentials.secret_key,
+            aws_session_token=credentials.token,
+            region_name=self.region
+        )
+        
+        semaphore = asyncio.Semaphore(DESCRIBE_CONCURRENCY)
+        
+        async with session.client('eks', config=_CLIENT_CONFIG) as eks:
+            async def describe(name):
+                async with semaphore:
+                    return (await eks.describe_cluster(name=name))['cluster']
+            
+            cluster_names = []
+            async for page in eks.get_paginator('list_clusters').paginate():
+                cluster_names.extend(page['clusters'])
+            return await asyncio.gather(*[describe(name) for name in cluster_names])
+    
     def create_cluster(self, cluster_name, node_group_name="default-nodes"):
         """Create a new EKS cluster using eksctl"""
         try:
             # Check if eksctl is installed
-            result = subprocess.run(['eksctl', 'version'], capture_output=True, text=True)
-            if result.returncode != 0:
+            if not _eksctl_path():
                 return False, "eksctl is not installed. Please install it first."
             
+            running = st.session_state.get('eksctl_proc')
+            if running is not None and running.poll() is None:
+                return False, "A cluster creation is already in progress."
+            
             # Create cluster with eksctl
             cmd = [
                 'eksctl', 'create', 'cluster',
@@ -183,25 +716,87 @@ class AWSEKSIntegration:
                 '--managed'
             ]
             
+            # eksctl runs for 10-15 minutes, so start it in the background with
+            # the session's credentials and let reruns poll it. Output goes to a
+            # log file because an undrained pipe would eventually block eksctl.
+            credentials = self.session.get_credentials().get_frozen_credentials()
+            env = dict(os.environ)
+            # Drop the parent's token and profile so eksctl can't mix them
+            # with the session's keys
+            env.pop('AWS_SESSION_TOKEN', None)
+            env.pop('AWS_PROFILE', None)
+            env['AWS_ACCESS_KEY_ID'] = credentials.access_key
+            env['AWS_SECRET_ACCESS_KEY'] = credentials.secret_key
+            if credentials.token:
+                env['AWS_SESSION_TOKEN'] = credentials.token
+            
+            with tempfile.NamedTemporaryFile(prefix=f"eksctl-{cluster_name}-", suffix=".log", delete=False) as log_file:
+                process = subprocess.Popen(cmd, stdout=log_file, stderr=subprocess.STDOUT, env=env)
+            
+            st.session_state['eksctl_proc'] = process
+            st.session_state['eksctl_log'] = log_file.name
+            
             return True, f"Cluster creation started. Command: {' '.join(cmd)}"
             
         except Exception as e:
             return False, str(e)
     
-    def get_cluster_kubeconfig(self, cluster_name):
-        """Update kubeconfig for the cluster"""
+    def generate_eks_token(self, cluster_name):
+        """Generate an EKS bearer token from a presigned STS GetCallerIdentity URL"""
+        signer = RequestSigner(
+            self.sts_client.meta.service_model.service_id,
+            self.region,
+            'sts',
+            'v4',
+            self.session.get_credentials(),
+            self.session.events
+        )
+        presigned_url = signer.generate_presigned_url(
+            {
+                'method': 'GET',
+                'url': f'https://sts.{self.region}.amazonaws.com/?Action=GetCallerIdentity&Version=2011-06-15',
+                'body': {},
+                'headers': {'x-k8s-aws-id': cluster_name},
+                'context': {}
+            },
+            region_name=self.region,
+            expires_in=60,
+            operation_name=''
+        )
+        encoded = base64.urlsafe_b64encode(presigned_url.encode('utf-8')).decode('utf-8')
+        return 'k8s-aws-v1.' + encoded.rstrip('=')
+    
+    def get_cluster_configuration(self, cluster_name):
+        """Build a Kubernetes client configuration that refreshes its own EKS token"""
+        from kubernetes import client
+        
         try:
-            cmd = [
-                'aws', 'eks', 'update-kubeconfig',
-                '--region', self.region,
-                '--name', cluster_name
-            ]
+            cluster = self.eks_client.describe_cluster(name=cluster_name)['cluster']
             
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            if result.returncode == 0:
-                return True, "Kubeconfig updated successfully"
-            else:
-                return False, result.stderr
+            # The client wants the CA bundle as a file path
+            with tempfile.NamedTemporaryFile(prefix=f'eks-{cluster_name}-', suffix='.crt', delete=False) as ca_file:
+                ca_file.write(base64.b64decode(cluster['certificateAuthority']['data']))
+            
+            configuration = client.Configuration()
+            configuration.host = cluster['endpoint']
+            configuration.ssl_ca_cert = ca_file.name
+            configuration.api_key_prefix['authorization'] = 'Bearer'
+            
+            # Called before every request, including from the pod watch thread,
+            # so the token is cached here rather than in a Streamlit cache that
+            # needs a script run context
+            token_lock = threading.Lock()
+            token = {'value': None, 'expires': 0.0}
+            
+            def refresh_token(conf):
+                with token_lock:
+                    if time.time() >= token['expires']:
+                        token['value'] = self.generate_eks_token(cluster_name)
+                        token['expires'] = time.time() + _EKS_TOKEN_TTL_SECONDS
+                    conf.api_key['authorization'] = token['value']
+            
+            configuration.refresh_api_key_hook = refresh_token
+            return True, configuration
                 
         except Exception as e:
             return False, str(e)
@@ -209,19 +804,8 @@ class AWSEKSIntegration:
     def get_kubernetes_client(self, cluster_name):
         """Get Kubernetes client for the cluster"""
         try:
-            # Update kubeconfig
-            success, message = self.get_cluster_kubeconfig(cluster_name)
-            if not success:
-                return None, message
-            
-            # Load kubeconfig
-            config.load_kube_config()
-            
-            # Create clients
-            v1 = client.CoreV1Api()
-            apps_v1 = client.AppsV1Api()
-            
-            return (v1, apps_v1), "Kubernetes client connected"
+            clients = _k8s_clients(self, cluster_name, self.region, self.credentials_key)
+            return clients, "Kubernetes client connected"
             
         except Exception as e:
             return None, str(e)
@@ -234,26 +818,35 @@ class AWSEKSIntegration:
                 return False, message
             
             v1, _ = clients
-            pods = v1.list_namespaced_pod(namespace=namespace)
             
-            pod_list = []
-            for pod in pods.items:
-                pod_list.append({
-                    'name': pod.metadata.name,
-                    'status': pod.status.phase,
-                    'ready': sum(1 for c in pod.status.container_statuses or [] if c.ready),
-                    'total': len(pod.spec.containers),
-                    'restarts': sum(c.restart_count for c in pod.status.container_statuses or []),
-                    'age': pod.metadata.creation_timestamp
-                })
+            # Parse the raw response body directly instead of letting the
+            # client build a model object for every field of every pod
+            response = v1.list_namespaced_pod(namespace=namespace, _preload_content=False)
+            pods = _json_loads(response.data)
+            
+            pod_list = [_pod_summary(pod) for pod in pods['items']]
             
             return True, pod_list
             
         except Exception as e:
             return False, str(e)
     
+    def start_pod_watch(self, cluster_name, namespace='default'):
+        """Start syncing a namespace's pods on a background thread"""
+        clients, message = self.get_kubernetes_client(cluster_name)
+        if clients is None:
+            return False, message
+        
+        v1, _ = clients
+        pod_watch = {'pods': {}, 'synced': False, 'error': None, 'stop': threading.Event(), 'seen': time.time()}
+        threading.Thread(target=_sync_pods, args=(v1, namespace, pod_watch), daemon=True).start()
+        return True, pod_watch
+    
     def create_namespace(self, cluster_name, namespace_name):
         """Create a namespace"""
+        from kubernetes import client
+        from kubernetes.client.rest import ApiException
+        
         try:
             clients, message = self.get_kubernetes_client(cluster_name)
             if clients is None:
@@ -282,6 +875,8 @@ class AWSEKSIntegration:
     
     def deploy_application(self, cluster_name, namespace, app_name, image, replicas=3):
         """Deploy an application to the cluster"""
+        from kubernetes import client
+        
         try:
             clients, message = self.get_kubernetes_client(cluster_name)
             if clients is None:
@@ -346,8 +941,10 @@ class AWSEKSIntegration:
         except Exception as e:
             return False, str(e)
     
-    def get_service_endpoint(self, cluster_name, namespace, service_name):
-        """Get the external endpoint of a service"""
+    def watch_service_endpoint(self, cluster_name, namespace, service_name, timeout=120, on_event=None):
+        """Wait for a LoadBalancer service to get an external endpoint, up to `timeout` seconds"""
+        from kubernetes import watch
+        
         try:
             clients, message = self.get_kubernetes_client(cluster_name)
             if clients is None:
@@ -355,20 +952,129 @@ class AWSEKSIntegration:
             
             v1, _ = clients
             
-            service = v1.read_namespaced_service(
-                name=service_name,
-                namespace=namespace
-            )
+            # The watch opens with the service's current state, so an endpoint
+            # that is already assigned is returned straight away
+            service_watch = watch.Watch()
+            for event in service_watch.stream(
+                v1.list_namespaced_service,
+                namespace=namespace,
+                field_selector=f"metadata.name={service_name}",
+                timeout_seconds=timeout
+            ):
+                if on_event:
+                    on_event(event['type'])
+                
+                ingress = event['object'].status.load_balancer.ingress
+                if ingress:
+                    service_watch.stop()
+                    return True, f"http://{ingress[0].hostname or ingress[0].ip}"
             
-            if service.status.load_balancer.ingress:
-                endpoint = service.status.load_balancer.ingress[0].hostname
-                return True, f"http://{endpoint}"
-            else:
-                return False, "LoadBalancer endpoint not ready yet"
+            return False, f"LoadBalancer endpoint not ready after {timeout}s"
                 
         except Exception as e:
             return False, str(e)
 
+# Show credential warning if not configured
+if not check_credentials_configured():
+    st.error("🚨 **AWS Credentials Required!** Configure them in the sidebar or use `aws configure`.")
+
+def _log_mcp_step(mcp_commands, command, translates_to=None, code=None, language="bash"):
+    """Show an MCP command, record it for the summary, and optionally what it translates to"""
+    st.code(f"🗣️ MCP Command: {command}", language="text")
+    mcp_commands.append(command)
+    
+    if code is not None:
+        with st.expander("🔍 What this command does"):
+            st.write(f"**Translates to these {translates_to}:**")
+            st.code(code, language=language)
+
+def show_deploy_guide(cluster_name, region):
+    """Show how to repeat a deployment from Kiro and where to verify it"""
+    # Show how to use with Kiro
+    st.markdown("---")
+    st.subheader("🎯 How to Use This with Kiro IDE")
+    st.markdown(_KIRO_STEPS_MD)
+    
+    # Show example commands
+    example_commands = [
+        f"Create a new EKS cluster named '{cluster_name}' in {region} region",
+        f"Create a namespace called 'dotnet-app' in the {cluster_name} cluster",
+        "Deploy my .NET Core application with 2 replicas and LoadBalancer service",
+        "Show me all pods in the dotnet-app namespace and their status",
+        "Get the LoadBalancer endpoint for my application"
+    ]
+    
+    for i, cmd in enumerate(example_commands, 1):
+        st.code(f"{i}. {cmd}", language="text")
+    
+    st.markdown(_KIRO_RESULT_MD)
+    
+    # Add link to check AWS Console
+    st.markdown("---")
+    st.subheader("🔍 Verify in AWS Console")
+    st.markdown(_AWS_CONSOLE_MD_TMPL.format(region=region, cluster_name=cluster_name))
+    
+    # Show kubectl commands to verify
+    st.subheader("💻 Verify with kubectl")
+    st.code(_KUBECTL_VERIFY_TMPL.format(region=region, cluster_name=cluster_name), language="bash")
+
+def show_pods(pods, namespace):
+    """Render a pod table and summary metrics"""
+    st.subheader(f"🚀 Pods in {namespace} namespace")
+    
+    # One table instead of an expander per pod
+    pods_df = pd.DataFrame(pods)
+    
+    # Ages in hours for the whole namespace from a single clock read
+    now = pd.Timestamp.now(tz='UTC')
+    age_s = (now - pd.to_datetime(pods_df['age'], utc=True)).dt.total_seconds()
+    pods_df['age_h'] = (age_s / 3600).round(1)
+    
+    st.dataframe(
+        pods_df[['name', 'status', 'ready', 'total', 'restarts', 'age_h']],
+        hide_index=True,
+        use_container_width=True
+    )
+    
+    # Summary metrics
+    st.subheader("📈 Pod Summary")
+    col1, col2, col3, col4 = st.columns(4)
+    
+    total_pods = len(pods_df)
+    running_pods = int((pods_df['status'] == 'Running').sum())
+    ready_pods = int((pods_df['ready'] == pods_df['total']).sum())
+    total_restarts = int(pods_df['restarts'].sum())
+    
+    with col1:
+        st.metric("Total Pods", total_pods)
+    with col2:
+        st.metric("Running", running_pods)
+    with col3:
+        st.metric("Ready", ready_pods)
+    with col4:
+        st.metric("Total Restarts", total_restarts)
+
+def show_cluster_creation_progress():
+    """Show output of a background `eksctl create cluster` run, if one was started"""
+    process = st.session_state.get('eksctl_proc')
+    if process is None:
+        return
+    
+    st.subheader("🏗️ Cluster Creation Progress")
+    
+    returncode = process.poll()
+    if returncode is None:
+        st.info("⏳ eksctl is still running. This may take 10-15 minutes...")
+        st.button("🔄 Refresh Progress")
+    elif returncode == 0:
+        st.success("✅ Cluster creation finished")
+    else:
+        st.error(f"❌ eksctl exited with code {returncode}")
+    
+    with open(st.session_state['eksctl_log']) as log_file:
+        output = log_file.read()
+    st.code(output[-5000:] or "Waiting for eksctl output...", language="text")
+
 # Sidebar navigation
 st.sidebar.title("🚀 EKS Demo Navigation")
 page = st.sidebar.selectbox("Choose a page:", [
@@ -379,18 +1085,25 @@ page = st.sidebar.selectbox("Choose a page:", [
     "🔍 Cluster Monitor"
 ])
 
+def _stop_pod_watch():
+    pod_watch = st.session_state.pop('pod_watch', None)
+    if pod_watch is not None:
+        pod_watch['stop'].set()
+
+# Keep the live pod watch alive only while its view is showing. This runs
+# before anything below can st.stop(), and the heartbeat lets the thread end
+# on its own when the browser session goes away.
+if page == "🔍 Cluster Monitor" and st.session_state.get('live_pods'):
+    if 'pod_watch' in st.session_state:
+        st.session_state['pod_watch']['seen'] = time.time()
+else:
+    _stop_pod_watch()
+
 # Configure AWS credentials in sidebar
 credentials_configured = configure_aws_credentials()
 
-# Initialize AWS with session state credentials if available
-if 'aws_access_key' in st.session_state and 'aws_secret_key' in st.session_state:
-    aws_eks = AWSEKSIntegration(
-        region=st.session_state.get('aws_region', 'us-west-2'),
-        access_key=st.session_state['aws_access_key'],
-        secret_key=st.session_state['aws_secret_key']
-    )
-else:
-    aws_eks = get_aws_integration()
+# Initialize AWS with session state credentials if available, else the CLI chain
+aws_eks = get_aws_integration(st.session_state.get('cli_region'))
 
 # Check AWS credentials
 st.sidebar.header("🔐 AWS Connection Status")
@@ -410,14 +1123,7 @@ if creds_valid:
 else:
     st.sidebar.error("❌ AWS Not Connected")
     if not credentials_configured:
-        st.sidebar.markdown("""
-        **Configure credentials above ☝️**
-        
-        Or use AWS CLI:
-        ```bash
-        aws configure
-        ```
-        """)
+        st.sidebar.markdown(_SIDEBAR_CLI_HINT_MD)
     
     # Add a prominent warning at the top of the main page
     if page == "🏠 Main Demo":
@@ -425,15 +1131,22 @@ else:
         st.info("💡 **Quick Setup:** Enter your AWS Access Key and Secret Key in the sidebar form.")
         st.stop()
 
+if st.sidebar.button("🔄 Refresh AWS Data"):
+    _cached_caller_identity.clear()
+    _cached_cluster_names.clear()
+    _cached_describe.clear()
+    _cached_list_clusters.clear()
+    _k8s_clients.clear()
+    st.rerun()
+
 # Region selector (only if using CLI credentials)
 if 'aws_access_key' not in st.session_state:
     aws_region = st.sidebar.selectbox("AWS Region", 
         ["us-west-2", "us-east-1", "us-west-1", "eu-west-1"], 
-        index=0)
+        index=0, key='cli_region')
     
     if aws_region != aws_eks.region:
-        aws_eks.region = aws_region
-        aws_eks = AWSEKSIntegration(aws_region)
+        aws_eks = get_aws_integration(aws_region)
 else:
     aws_region = st.session_state.get('aws_region', 'us-west-2')
 
@@ -447,47 +1160,14 @@ if page == "🏠 Main Demo":
     
     if not creds_valid:
         st.error("🚨 **AWS Credentials Not Configured!**")
-        st.markdown("""
-        ### 🔧 Quick Setup Instructions:
-        
-        1. **Install AWS CLI** (if not already installed):
-           ```bash
-           pip install awscli
-           ```
-        
-        2. **Configure your credentials**:
-           ```bash
-           aws configure
-           ```
-           
-        3. **Enter your AWS details**:
-           - **AWS Access Key ID**: Your access key
-           - **AWS Secret Access Key**: Your secret key  
-           - **Default region**: us-west-2 (or your preferred region)
-           - **Default output format**: json
-        
-        4. **Verify connection**:
-           ```bash
-           aws sts get-caller-identity
-           ```
-        
-        ### 🔑 Where to get AWS credentials:
-        - Go to [AWS Console](https://console.aws.amazon.com/)
-        - Navigate to **IAM** → **Users** → **Your User** → **Security credentials**
-        - Click **Create access key**
-        
-        ### 🛡️ Required permissions:
-        Your AWS user needs permissions for:
-        - EKS (Elastic Kubernetes Service)
-        - EC2 (for worker nodes)
-        - ECR (Elastic Container Registry)
-        - IAM (for cluster roles)
-        """)
+        with st.expander("🔧 Setup help", expanded=False):
+            st.markdown(_SETUP_MD)
         st.stop()
     
-    # Get existing clusters
-    success, clusters = aws_eks.list_clusters()
-    cluster_names = [c['name'] for c in clusters] if success else []
+    # Get existing cluster names; details are described on demand
+    success, cluster_names = aws_eks.list_cluster_names()
+    if not success:
+        cluster_names = []
     
     if cluster_names:
         cluster_option = st.selectbox("Select Cluster", 
@@ -503,6 +1183,8 @@ if page == "🏠 Main Demo":
         selected_cluster = st.text_input("Cluster Name", "dotnet-demo-cluster")
         create_new = True
     
+    show_cluster_creation_progress()
+    
     # Main interface
     col1, col2 = st.columns([1, 1])
     
@@ -550,15 +1232,27 @@ if page == "🏠 Main Demo":
     with col2:
         st.header("🏗️ Current EKS Clusters")
         
-        if success and clusters:
-            for cluster in clusters:
-                with st.expander(f"📊 {cluster['name']}", expanded=False):
-                    col_a, col_b = st.columns(2)
-                    with col_a:
-                        st.write(f"**Status:** {cluster['status']}")
-                        st.write(f"**Version:** {cluster['version']}")
-                    with col_b:
-                        st.write(f"**Created:** {cluster['created'].strftime('%Y-%m-%d')}")
+        if cluster_names:
+            # Clusters are only described once their details toggle is switched on
+            if st.button("🔄 Load All Details"):
+                for cluster_name in cluster_names:
+                    st.session_state[f"expanded_{aws_eks.region}_{cluster_name}"] = True
+            
+            for cluster_name in cluster_names:
+                with st.expander(f"📊 {cluster_name}", expanded=False):
+                    if not st.toggle("Show details", key=f"expanded_{aws_eks.region}_{cluster_name}"):
+                        continue
+                    
+                    desc_success, cluster = aws_eks.describe_cluster(cluster_name)
+                    if not desc_success:
+                        st.error(f"Error: {cluster}")
+                        continue
+                    
+                    # Already inside col2, and Streamlit allows only one level of
+                    # column nesting, so the details are written one per line
+                    st.write(f"**Status:** {cluster['status']}")
+                    st.write(f"**Version:** {cluster['version']}")
+                    st.write(f"**Created:** {cluster['created'].strftime('%Y-%m-%d')}")
                     
                     # Show pods if cluster is active
                     if cluster['status'] == 'ACTIVE':
@@ -593,48 +1287,13 @@ if page == "🏠 Main Demo":
             if len(parts) >= 2:
                 owner, repo = parts[0], parts[1]
                 
-                # Check if repo exists via GitHub API
-                api_url = f"https://api.github.com/repos/{owner}/{repo}"
-                response = requests.get(api_url)
-                
-                if response.status_code == 200:
-                    repo_info = response.json()
-                    
-                    # Try to get project files
-                    contents_url = f"https://api.github.com/repos/{owner}/{repo}/contents"
-                    contents_response = requests.get(contents_url)
-                    
-                    analysis = {
-                        "framework": "net8.0",
-                        "project_type": "Web API",
-                        "has_dockerfile": False,
-                        "dependencies": [],
-                        "endpoints": [],
-                        "database_required": needs_database,
-                        "repo_info": repo_info
-                    }
-                    
-                    if contents_response.status_code == 200:
-                        files = contents_response.json()
-                        file_names = [f['name'] for f in files if isinstance(files, list)]
-                        
-                        # Check for .NET project files
-                        csproj_files = [f for f in file_names if f.endswith('.csproj')]
-                        if csproj_files:
-                            analysis["has_csproj"] = True
-                        
-                        # Check for Dockerfile
-                        if 'Dockerfile' in file_names or any('Dockerfile' in f for f in file_names):
-                            analysis["has_dockerfile"] = True
-                        
-                        # Check for common .NET files
-                        if 'Program.cs' in file_names:
-                            analysis["has_program_cs"] = True
-                    
-                    return analysis
-                else:
-                    st.error(f"Repository not found or not accessible: {response.status_code}")
+                try:
+                    analysis = _analyze_repo(owner, repo)
+                except requests.HTTPError as e:
+                    st.error(f"Repository not found or not accessible: {e.response.status_code}")
                     return None
+                
+                return {**analysis, "database_required": needs_database}
         except Exception as e:
             st.error(f"Error analyzing repository: {str(e)}")
             return None
@@ -644,32 +1303,41 @@ if page == "🏠 Main Demo":
         deployment_steps = []
         mcp_commands = []
         
+        # Fail fast on an existing cluster that can't take workloads, before any
+        # Kubernetes calls are made against it. The describe is normally a cache
+        # hit from rendering the deploy button.
+        if not create_new:
+            cluster_ok, cluster = aws_eks.describe_cluster(cluster_name)
+            if not cluster_ok:
+                return [("Pre-check", False, cluster)]
+            if cluster['status'] != 'ACTIVE':
+                return [("Pre-check", False, f"Cluster is {cluster['status']}")]
+        
+        # Namespace creation runs in the background while the command panels
+        # render; its result is read back in step order and deployment waits on
+        # it. The worker carries this run's script context so the cached helpers
+        # it calls behave as they would on the main thread.
+        executor = ThreadPoolExecutor(
+            max_workers=1,
+            initializer=add_script_run_ctx,
+            initargs=(None, get_script_run_ctx())
+        )
+        
         try:
             st.subheader("🤖 EKS MCP Commands Being Executed")
             
+            namespace_future = executor.submit(aws_eks.create_namespace, cluster_name, namespace)
+            
             # Step 1: Create or verify cluster
             if create_new:
                 st.write("🏗️ Creating EKS cluster...")
                 
-                # Show MCP command
-                mcp_command = f"Create a new EKS cluster named '{cluster_name}' in {aws_region} region with Kubernetes version 1.31 and managed node groups"
-                st.code(f"🗣️ MCP Command: {mcp_command}", language="text")
-                mcp_commands.append(mcp_command)
-                
-                # Show what this translates to
-                with st.expander("🔍 What this command does"):
-                    st.write("**Translates to these AWS operations:**")
-                    st.code(f"""
-eksctl create cluster \\
-  --name {cluster_name} \\
-  --region {aws_region} \\
-  --nodegroup-name default-nodes \\
-  --node-type t3.medium \\
-  --nodes 2 \\
-  --nodes-min 1 \\
-  --nodes-max 4 \\
-  --managed
-                    """, language="bash")
+                _log_mcp_step(
+                    mcp_commands,
+                    f"Create a new EKS cluster named '{cluster_name}' in {aws_region} region with Kubernetes version 1.31 and managed node groups",
+                    "AWS operations",
+                    _EKSCTL_CREATE_TMPL.format(cluster_name=cluster_name, region=aws_region)
+                )
                 
                 # Actually execute
                 success, message = aws_eks.create_cluster(cluster_name)
@@ -682,24 +1350,22 @@ eksctl create cluster \\
                 else:
                     st.error(f"❌ MCP Error: {message}")
             else:
-                mcp_command = f"Use existing cluster '{cluster_name}' for deployment"
-                st.code(f"🗣️ MCP Command: {mcp_command}", language="text")
-                mcp_commands.append(mcp_command)
-                deployment_steps.append(("Cluster Selection", True, f"Using existing cluster: {cluster_name}"))
+                _log_mcp_step(mcp_commands, f"Use existing cluster '{cluster_name}' for deployment")
+                
+                deployment_steps.append(("Cluster Selection", True, f"Using existing cluster: {cluster_name} ({cluster['status']})"))
                 st.success(f"✅ Using existing cluster: {cluster_name}")
             
             # Step 2: Create namespace
             st.write("📦 Creating namespace...")
             
-            mcp_command = f"Create a namespace called '{namespace}' in the {cluster_name} cluster"
-            st.code(f"🗣️ MCP Command: {mcp_command}", language="text")
-            mcp_commands.append(mcp_command)
-            
-            with st.expander("🔍 What this command does"):
-                st.write("**Translates to these Kubernetes operations:**")
-                st.code(f"kubectl create namespace {namespace}", language="bash")
+            _log_mcp_step(
+                mcp_commands,
+                f"Create a namespace called '{namespace}' in the {cluster_name} cluster",
+                "Kubernetes operations",
+                f"kubectl create namespace {namespace}"
+            )
             
-            success, message = aws_eks.create_namespace(cluster_name, namespace)
+            success, message = namespace_future.result()
             deployment_steps.append(("Namespace Creation", success, message))
             
             if success:
@@ -711,33 +1377,13 @@ eksctl create cluster \\
             if needs_db:
                 st.write("🗄️ Deploying SQL Server...")
                 
-                mcp_command = f"Deploy SQL Server to {namespace} namespace with persistent storage, 2Gi memory limit, and proper resource constraints"
-                st.code(f"🗣️ MCP Command: {mcp_command}", language="text")
-                mcp_commands.append(mcp_command)
-                
-                with st.expander("🔍 What this command does"):
-                    st.write("**Translates to these Kubernetes resources:**")
-                    st.code("""
-apiVersion: apps/v1
-kind: Deployment
-metadata:
-  name: sqlserver
-  namespace: dotnet-app
-spec:
-  replicas: 1
-  selector:
-    matchLabels:
-      app: sqlserver
-  template:
-    spec:
-      containers:
-      - name: sqlserver
-        image: mcr.microsoft.com/mssql/server:2022-latest
-        resources:
-          requests:
-            memory: "2Gi"
-            cpu: "1000m"
-                    """, language="yaml")
+                _log_mcp_step(
+                    mcp_commands,
+                    f"Deploy SQL Server to {namespace} namespace with persistent storage, 2Gi memory limit, and proper resource constraints",
+                    "Kubernetes resources",
+                    _YAML_SQLSERVER,
+                    language="yaml"
+                )
                 
                 deployment_steps.append(("Database Deployment", True, "SQL Server deployment initiated"))
                 st.success("✅ MCP Response: SQL Server deployment configuration created")
@@ -745,29 +1391,20 @@ spec:
             # Step 4: Deploy application
             st.write("🚀 Deploying application...")
             
-            mcp_command = f"Deploy the .NET Core application to {namespace} namespace with 2 replicas, LoadBalancer service, and health checks enabled"
-            st.code(f"🗣️ MCP Command: {mcp_command}", language="text")
-            mcp_commands.append(mcp_command)
-            
-            with st.expander("🔍 What this command does"):
-                st.write("**Translates to these Kubernetes operations:**")
-                st.code(f"""
-kubectl create deployment dotnet-app \\
-  --image=mcr.microsoft.com/dotnet/samples:aspnetapp \\
-  --replicas=2 \\
-  --namespace={namespace}
-
-kubectl expose deployment dotnet-app \\
-  --type=LoadBalancer \\
-  --port=80 \\
-  --target-port=8080 \\
-  --namespace={namespace}
-                """, language="bash")
+            _log_mcp_step(
+                mcp_commands,
+                f"Deploy the .NET Core application to {namespace} namespace with 2 replicas, LoadBalancer service, and health checks enabled",
+                "Kubernetes operations",
+                _KUBECTL_DEPLOY_TMPL.format(namespace=namespace)
+            )
             
             sample_image = "mcr.microsoft.com/dotnet/samples:aspnetapp"
-            success, message = aws_eks.deploy_application(
-                cluster_name, namespace, "dotnet-app", sample_image, 2
-            )
+            if all(step_ok for _, step_ok, _ in deployment_steps):
+                success, message = aws_eks.deploy_application(
+                    cluster_name, namespace, "dotnet-app", sample_image, 2
+                )
+            else:
+                success, message = False, "Skipped: an earlier step failed"
             deployment_steps.append(("Application Deployment", success, message))
             
             if success:
@@ -779,16 +1416,22 @@ kubectl expose deployment dotnet-app \\
             if success:
                 st.write("🌐 Getting service endpoint...")
                 
-                mcp_command = f"Get the LoadBalancer endpoint for the dotnet-app service in {namespace} namespace"
-                st.code(f"🗣️ MCP Command: {mcp_command}", language="text")
-                mcp_commands.append(mcp_command)
-                
-                with st.expander("🔍 What this command does"):
-                    st.write("**Translates to these Kubernetes operations:**")
-                    st.code(f"kubectl get service dotnet-app-service -n {namespace} -o wide", language="bash")
+                _log_mcp_step(
+                    mcp_commands,
+                    f"Get the LoadBalancer endpoint for the dotnet-app service in {namespace} namespace",
+                    "Kubernetes operations",
+                    f"kubectl get service dotnet-app-service -n {namespace} -o wide"
+                )
                 
-                time.sleep(5)
-                success, endpoint = aws_eks.get_service_endpoint(cluster_name, namespace, "dotnet-app-service")
+                with st.status("Waiting for the LoadBalancer endpoint...") as endpoint_status:
+                    success, endpoint = aws_eks.watch_service_endpoint(
+                        cluster_name, namespace, "dotnet-app-service",
+                        on_event=lambda event_type: endpoint_status.write(f"Service event: {event_type}")
+                    )
+                    endpoint_status.update(
+                        label="LoadBalancer endpoint assigned" if success else "LoadBalancer endpoint not ready",
+                        state="complete" if success else "error"
+                    )
                 deployment_steps.append(("Service Endpoint", success, endpoint if success else "Endpoint not ready yet"))
                 
                 if success:
@@ -800,8 +1443,7 @@ kubectl expose deployment dotnet-app \\
             st.subheader("📋 Complete MCP Command Sequence")
             st.write("**These are the natural language commands that were executed:**")
             
-            for i, cmd in enumerate(mcp_commands, 1):
-                st.write(f"**{i}.** {cmd}")
+            st.markdown("\n".join(f"{i}. {cmd}" for i, cmd in enumerate(mcp_commands, 1)))
             
             st.info("💡 **In Kiro IDE**, you would type these commands in natural language and the EKS MCP server would execute them automatically!")
             
@@ -810,9 +1452,17 @@ kubectl expose deployment dotnet-app \\
         except Exception as e:
             deployment_steps.append(("Deployment Error", False, str(e)))
             return deployment_steps
+        
+        finally:
+            executor.shutdown(wait=False)
     
-    # Main deployment logic
+    # Main deployment logic. The Execute button below is only seen on the
+    # rerun after Deploy was clicked, so the request is kept in session state
     if deploy_button:
+        st.session_state['deploy_requested'] = True
+        st.session_state.pop('last_deploy_ok', None)
+    
+    if st.session_state.get('deploy_requested'):
         if github_url:
             is_valid, message = validate_github_url(github_url)
             
@@ -844,7 +1494,16 @@ kubectl expose deployment dotnet-app \\
                     # Execute real deployment
                     st.subheader("🚀 Real EKS Deployment")
                     
-                    if st.button("Execute Real Deployment", type="primary"):
+                    # Only an ACTIVE existing cluster can take the deployment
+                    cluster_not_ready = False
+                    if not create_new:
+                        status_ok, status_info = aws_eks.describe_cluster(selected_cluster)
+                        cluster_not_ready = not status_ok or status_info['status'] != 'ACTIVE'
+                        if cluster_not_ready:
+                            st.warning(f"⏳ Cluster {selected_cluster} is not ACTIVE yet: "
+                                       f"{status_info['status'] if status_ok else status_info}")
+                    
+                    if st.button("Execute Real Deployment", type="primary", disabled=cluster_not_ready):
                         namespace = "dotnet-app"
                         
                         with st.spinner("Deploying to EKS..."):
@@ -861,78 +1520,10 @@ kubectl expose deployment dotnet-app \\
                             else:
                                 st.error(f"❌ **{step_name}:** {message}")
                         
-                        # Show how to use with Kiro
-                        st.markdown("---")
-                        st.subheader("🎯 How to Use This with Kiro IDE")
-                        
-                        st.markdown("""
-                        ### 🔧 **Step 1: Configure EKS MCP in Kiro**
-                        
-                        1. **Download MCP config** from the "🔧 MCP Configuration" page
-                        2. **Place in Kiro**: `.kiro/settings/mcp.json`
-                        3. **Restart Kiro** or reload MCP servers
-                        
-                        ### 💬 **Step 2: Chat with EKS MCP Server**
-                        
-                        In Kiro chat, you can now use these **exact natural language commands**:
-                        """)
-                        
-                        # Show example commands
-                        example_commands = [
-                            f"Create a new EKS cluster named '{selected_cluster}' in {aws_region} region",
-                            f"Create a namespace called 'dotnet-app' in the {selected_cluster} cluster",
-                            "Deploy my .NET Core application with 2 replicas and LoadBalancer service",
-                            "Show me all pods in the dotnet-app namespace and their status",
-                            "Get the LoadBalancer endpoint for my application"
-                        ]
-                        
-                        for i, cmd in enumerate(example_commands, 1):
-                            st.code(f"{i}. {cmd}", language="text")
-                        
-                        st.markdown("""
-                        ### 🎉 **Result in Kiro**
-                        
-                        Kiro will execute these commands and show you:
-                        - ✅ **Real-time progress** of cluster creation
-                        - ✅ **Live deployment status** 
-                        - ✅ **Actual service endpoints**
-                        - ✅ **Error troubleshooting** if issues occur
-                        
-                        **This Streamlit demo shows you what happens behind the scenes!**
-                        """)
-                        
-                        # Add link to check AWS Console
-                        st.markdown("---")
-                        st.subheader("🔍 Verify in AWS Console")
-                        
-                        aws_console_url = f"https://{aws_region}.console.aws.amazon.com/eks/home?region={aws_region}#/clusters"
-                        st.markdown(f"""
-                        **Check your AWS Console to see the real resources:**
-                        
-                        🔗 [Open EKS Console]({aws_console_url})
-                        
-                        You should see:
-                        - **EKS Cluster**: `{selected_cluster}`
-                        - **Node Groups**: Running EC2 instances  
-                        - **Workloads**: Deployed applications
-                        """)
-                        
-                        # Show kubectl commands to verify
-                        st.subheader("💻 Verify with kubectl")
-                        st.code(f"""
-# Connect to your cluster
-aws eks update-kubeconfig --region {aws_region} --name {selected_cluster}
-
-# Check cluster nodes
-kubectl get nodes
-
-# Check your application
-kubectl get pods -n dotnet-app
-kubectl get services -n dotnet-app
-
-# Get LoadBalancer URL
-kubectl get service dotnet-app-service -n dotnet-app -o wide
-                        """, language="bash")
+                        # Only point at the resources once they actually exist
+                        st.session_state['last_deploy_ok'] = all(ok for _, ok, _ in deployment_results)
+                        if st.session_state['last_deploy_ok']:
+                            show_deploy_guide(selected_cluster, aws_region)
             else:
                 st.error(f"❌ {message}")
         else:
@@ -943,15 +1534,12 @@ elif page == "🤖 Strands Agent":
     st.title("🤖 Strands Agent - Natural Language EKS Operations")
     st.markdown("Interact with your EKS clusters using natural language through the Strands agent.")
     
-    # Initialize Strands agent
-    if 'aws_access_key' in st.session_state and 'aws_secret_key' in st.session_state:
-        strands_agent = StrandsEKSAgent(
-            region=st.session_state.get('aws_region', 'us-west-2'),
-            access_key=st.session_state['aws_access_key'],
-            secret_key=st.session_state['aws_secret_key']
-        )
-    else:
-        strands_agent = StrandsEKSAgent(region=st.session_state.get('aws_region', 'us-west-2'))
+    # Strands agent for this session's credentials, reused across reruns
+    strands_agent = _cached_strands_agent(
+        aws_eks.region,
+        st.session_state.get('aws_access_key'),
+        st.session_state.get('aws_secret_key')
+    )
     
     # Show available tasks
     with st.expander("📋 Available Tasks"):
@@ -1043,19 +1631,28 @@ elif page == "🤖 Strands Agent":
     st.markdown("---")
     st.subheader("🎯 Set Context")
     
-    # Get list of clusters
-    clusters_result = strands_agent.list_clusters()
-    if clusters_result['status'] == 'success' and clusters_result['data']['clusters']:
-        selected_cluster = st.selectbox(
-            "Select a cluster for context:",
-            options=clusters_result['data']['clusters'],
-            key='cluster_selector'
-        )
-        if selected_cluster:
-            st.session_state['selected_cluster'] = selected_cluster
-            st.success(f"✅ Context set to: {selected_cluster}")
-    else:
-        st.info("No clusters found. Create one first!")
+    # Expander bodies still run when collapsed, so the cluster list is gated
+    # behind a toggle: other clicks on this page don't touch ListClusters
+    if 'selected_cluster' in st.session_state:
+        st.caption(f"Current context: {st.session_state['selected_cluster']}")
+    
+    if st.toggle("Choose a cluster", key='show_context'):
+        # Cached for 30s so reruns while choosing don't hit ListClusters either
+        if st.button("🔄 Refresh", key='refresh_context_clusters'):
+            _cached_cluster_names.clear()
+        
+        names_success, context_clusters = aws_eks.list_cluster_names()
+        if names_success and context_clusters:
+            selected_cluster = st.selectbox(
+                "Select a cluster for context:",
+                options=context_clusters,
+                key='cluster_selector'
+            )
+            if selected_cluster:
+                st.session_state['selected_cluster'] = selected_cluster
+                st.success(f"✅ Context set to: {selected_cluster}")
+        else:
+            st.info("No clusters found. Create one first!")
 
 # PAGE 3: MCP CONFIGURATION
 elif page == "🔧 MCP Configuration":
@@ -1078,33 +1675,13 @@ elif page == "🔧 MCP Configuration":
         st.subheader("Auto-approve Tools")
         st.markdown("Select tools that should be auto-approved:")
         
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            auto_list_clusters = st.checkbox("list_clusters", value=True)
-            auto_describe_cluster = st.checkbox("describe_cluster", value=True)
-            auto_list_pods = st.checkbox("list_pods", value=True)
-            auto_get_pod_logs = st.checkbox("get_pod_logs", value=True)
-        
-        with col2:
-            auto_list_services = st.checkbox("list_services", value=True)
-            auto_list_deployments = st.checkbox("list_deployments", value=True)
-            auto_get_events = st.checkbox("get_events", value=True)
-            auto_describe_nodes = st.checkbox("describe_nodes", value=True)
+        selected_tools = st.multiselect("Auto-approve tools", _MCP_TOOLS, default=list(_MCP_TOOLS))
         
         submitted = st.form_submit_button("Generate Configuration")
         
         if submitted:
-            # Build auto-approve list
-            auto_approve = []
-            if auto_list_clusters: auto_approve.append("list_clusters")
-            if auto_describe_cluster: auto_approve.append("describe_cluster")
-            if auto_list_pods: auto_approve.append("list_pods")
-            if auto_get_pod_logs: auto_approve.append("get_pod_logs")
-            if auto_list_services: auto_approve.append("list_services")
-            if auto_list_deployments: auto_approve.append("list_deployments")
-            if auto_get_events: auto_approve.append("get_events")
-            if auto_describe_nodes: auto_approve.append("describe_nodes")
+            # Keep the tools in their canonical order regardless of click order
+            auto_approve = [tool for tool in _MCP_TOOLS if tool in selected_tools]
             
             # Build MCP configuration
             mcp_config = {
@@ -1137,7 +1714,8 @@ elif page == "🔧 MCP Configuration":
             
             # Display configuration
             st.subheader("📄 Generated MCP Configuration")
-            st.code(json.dumps(mcp_config, indent=2), language="json")
+            config_json = _json_dumps_pretty(mcp_config)
+            st.code(config_json, language="json")
             
             # Instructions
             st.subheader("📋 Setup Instructions")
@@ -1153,7 +1731,6 @@ elif page == "🔧 MCP Configuration":
             """)
             
             # Download button
-            config_json = json.dumps(mcp_config, indent=2)
             st.download_button(
                 label="📥 Download mcp.json",
                 data=config_json,
@@ -1166,40 +1743,10 @@ elif page == "📚 Example Commands":
     st.title("📚 EKS MCP Natural Language Commands")
     st.markdown("Here are example natural language commands you can use with the EKS MCP server in Kiro IDE.")
     
-    # Command categories
-    categories = {
-        "🏗️ Cluster Management": [
-            "Create a new EKS cluster named 'my-cluster' in us-west-2 region",
-            "Show me all EKS clusters and their status",
-            "Delete the cluster named 'old-cluster'",
-            "What's the status of my production-cluster?",
-            "Show me the VPC configuration for my staging cluster",
-            "Update my cluster to Kubernetes version 1.31"
-        ],
-        
-        "🚀 Application Deployment": [
-            "Deploy my .NET Core app to the production namespace with 3 replicas",
-            "Create a deployment from my ECR image with LoadBalancer service",
-            "Deploy SQL Server to the database namespace with persistent storage",
-            "Update my webapi deployment with the new image tag v2.0",
-            "Scale the frontend deployment to 5 replicas",
-            "Create a namespace called 'dotnet-app'"
-        ],
-        
-        "📊 Monitoring & Troubleshooting": [
-            "Show me all pods in the production namespace and their status",
-            "Get the logs from the api-server pod in the last 30 minutes",
-            "Why is my nginx-ingress-controller pod failing to start?",
-            "Show me events in the staging namespace for the last hour",
-            "List all services and their endpoints in the default namespace",
-            "Check the health of all nodes in my cluster"
-        ]
-    }
-    
     # Display commands by category
-    for category, commands in categories.items():
+    for category, commands in _EXAMPLE_COMMANDS.items():
         with st.expander(category, expanded=True):
-            for i, command in enumerate(commands, 1):
+            for command in commands:
                 st.code(command, language="text")
 
 # PAGE 5: CLUSTER MONITOR
@@ -1208,37 +1755,33 @@ elif page == "🔍 Cluster Monitor":
     
     if not creds_valid:
         st.error("🚨 **AWS Credentials Not Configured!**")
-        st.markdown("""
-        ### To use the cluster monitor, you need AWS credentials configured.
-        
-        **Quick setup:**
-        ```bash
-        aws configure
-        ```
-        
-        Then refresh this page to connect to your EKS clusters.
-        """)
+        st.markdown(_MONITOR_SETUP_MD)
+        _stop_pod_watch()
         st.stop()
     
     st.success("✅ Connected to AWS")
     
-    # Get clusters
-    success, clusters = aws_eks.list_clusters()
+    # Get clusters (cached for 30s so reruns don't re-describe every cluster)
+    if st.button("🔄 Refresh Clusters"):
+        _cached_list_clusters.clear()
+    
+    success, clusters_by_name = aws_eks.list_clusters_by_name()
     
     if not success:
-        st.error(f"Error fetching clusters: {clusters}")
+        st.error(f"Error fetching clusters: {clusters_by_name}")
+        _stop_pod_watch()
         st.stop()
     
-    if not clusters:
+    if not clusters_by_name:
         st.info("No EKS clusters found in this region.")
+        _stop_pod_watch()
         st.stop()
     
     # Cluster selector
-    cluster_names = [c['name'] for c in clusters]
-    selected_cluster = st.selectbox("Select Cluster to Monitor", cluster_names)
+    selected_cluster = st.selectbox("Select Cluster to Monitor", list(clusters_by_name))
     
     # Find selected cluster info
-    cluster_info = next(c for c in clusters if c['name'] == selected_cluster)
+    cluster_info = clusters_by_name[selected_cluster]
     
     # Display cluster overview
     st.subheader(f"📊 Cluster Overview: {selected_cluster}")
@@ -1262,6 +1805,7 @@ elif page == "🔍 Cluster Monitor":
     # Only show detailed monitoring if cluster is active
     if cluster_info['status'] != 'ACTIVE':
         st.warning(f"Cluster is {cluster_info['status']}. Detailed monitoring only available for ACTIVE clusters.")
+        _stop_pod_watch()
         st.stop()
     
     # Namespace selector
@@ -1270,47 +1814,44 @@ elif page == "🔍 Cluster Monitor":
     namespace_options = ['default', 'kube-system', 'dotnet-app', 'kube-public']
     selected_namespace = st.selectbox("Select Namespace", namespace_options)
     
+    # Live view: a background list+watch keeps the pods current, so reruns
+    # only re-render instead of re-listing the namespace
+    live_pods = st.toggle("📡 Live updates", key='live_pods')
+    
+    watch_key = (aws_eks.region, selected_cluster, selected_namespace)
+    pod_watch = st.session_state.get('pod_watch')
+    if pod_watch is not None and (not live_pods or pod_watch['key'] != watch_key):
+        _stop_pod_watch()
+        pod_watch = None
+    
+    if live_pods:
+        if pod_watch is None:
+            watch_ok, pod_watch = aws_eks.start_pod_watch(selected_cluster, selected_namespace)
+            if watch_ok:
+                pod_watch['key'] = watch_key
+                st.session_state['pod_watch'] = pod_watch
+            else:
+                st.error(f"Error watching pods: {pod_watch}")
+                pod_watch = None
+        
+        if pod_watch is not None:
+            if pod_watch['error']:
+                st.warning(f"Pod watch interrupted, retrying: {pod_watch['error']}")
+            if not pod_watch['synced']:
+                st.info("Loading pods...")
+            elif pod_watch['pods']:
+                show_pods(list(pod_watch['pods'].values()), selected_namespace)
+            else:
+                st.info(f"No pods found in {selected_namespace} namespace")
+    
     # Manual refresh button
-    if st.button("🔄 Refresh Pods"):
+    elif st.button("🔄 Refresh Pods"):
         with st.spinner("Fetching pod information..."):
             success, pods = aws_eks.list_pods(selected_cluster, selected_namespace)
         
         if success:
             if pods:
-                st.subheader(f"🚀 Pods in {selected_namespace} namespace")
-                
-                # Create a table-like display
-                for pod in pods:
-                    with st.expander(f"📦 {pod['name']}", expanded=False):
-                        col1, col2, col3 = st.columns(3)
-                        
-                        with col1:
-                            status_icon = "🟢" if pod['status'] == 'Running' else "🔴"
-                            st.write(f"**Status:** {status_icon} {pod['status']}")
-                            st.write(f"**Ready:** {pod['ready']}/{pod['total']}")
-                        
-                        with col2:
-                            st.write(f"**Restarts:** {pod['restarts']}")
-                            age = (time.time() - pod['age'].timestamp()) / 3600  # hours
-                            st.write(f"**Age:** {age:.1f}h")
-                
-                # Summary metrics
-                st.subheader("📈 Pod Summary")
-                col1, col2, col3, col4 = st.columns(4)
-                
-                total_pods = len(pods)
-                running_pods = sum(1 for p in pods if p['status'] == 'Running')
-                ready_pods = sum(1 for p in pods if p['ready'] == p['total'])
-                total_restarts = sum(p['restarts'] for p in pods)
-                
-                with col1:
-                    st.metric("Total Pods", total_pods)
-                with col2:
-                    st.metric("Running", running_pods)
-                with col3:
-                    st.metric("Ready", ready_pods)
-                with col4:
-                    st.metric("Total Restarts", total_restarts)
+                show_pods(pods, selected_namespace)
             else:
                 st.info(f"No pods found in {selected_namespace} namespace")
         else:
@@ -1362,4 +1903,11 @@ kubectl get pods -n {selected_namespace}
 # Footer
 st.markdown("---")
 st.markdown("**🚀 Real AWS EKS Integration** - This demo connects to your actual AWS account and EKS clusters!")
-st.markdown("Make sure you have `eksctl`, `kubectl`, and `docker` installed for full functionality.")
\ No newline at end of file
+st.markdown("Make sure you have `eksctl`, `kubectl`, and `docker` installed for full functionality.")
+
+# Re-render the live pod view every couple of seconds while its watch runs;
+# the API traffic is the watch itself, not these reruns. Watches for other
+# pages were already stopped near the top of the script.
+if 'pod_watch' in st.session_state:
+    time.sleep(2)
+    st.rerun()
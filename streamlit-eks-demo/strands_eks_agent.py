@@ -1,9 +1,518 @@
 """
 Strands Agent integration for EKS operations
 """
+import asyncio
 import boto3
+import contextlib
+import functools
+import hashlib
+import inspect
 import json
-from typing import Dict, List, Optional, Any
+import os
+import re
+import threading
+import time
+from botocore.config import Config
+from collections import OrderedDict
+from botocore.exceptions import ClientError, HTTPClientError
+from botocore.exceptions import ConnectionError as BotocoreConnectionError
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Any
+
+try:
+    import aioboto3
+except ImportError:
+    aioboto3 = None
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Upper bound on concurrent DescribeCluster calls, to stay clear of EKS throttling.
+# The Streamlit app imports it too, so every describe path shares one cap.
+DESCRIBE_CONCURRENCY = 8
+
+# Upper bound on regions listed at once by list_clusters_multi_region
+REGION_CONCURRENCY = 8
+
+# Adaptive retries rate-limit client-side once EKS starts throttling; the pool
+# is sized for the describe batcher's workers plus concurrent Streamlit reruns
+_CLIENT_CONFIG = Config(
+    retries={'mode': 'adaptive', 'max_attempts': 10},
+    max_pool_connections=50,
+    tcp_keepalive=True
+)
+
+# Sessions and clients shared by every agent in the process. Building a client
+# loads its service model and sets up TLS, so agents with the same region and
+# credentials reuse one set. Keys carry a digest of the secret, never the secret.
+# Both are LRUs, so credentials entered once (typos included) don't stay forever.
+_SESSION_CACHE_SIZE = 16
+_CLIENT_CACHE_SIZE = 3 * _SESSION_CACHE_SIZE  # eks, ec2 and ecr per session
+_sessions: 'OrderedDict[tuple, boto3.Session]' = OrderedDict()
+_clients: 'OrderedDict[tuple, Any]' = OrderedDict()
+_client_lock = threading.Lock()
+
+
+def _lru_get(cache: OrderedDict, key: tuple, create, maxsize: int) -> Any:
+    """Look up or create a cache entry; call with _client_lock held."""
+    value = cache.get(key)
+    if value is None:
+        value = cache[key] = create()
+        while len(cache) > maxsize:
+            cache.popitem(last=False)
+    else:
+        cache.move_to_end(key)
+    return value
+
+
+def _credentials_key(region: str, access_key: Optional[str], secret_key: Optional[str]) -> tuple:
+    if not (access_key and secret_key):
+        return (region, None, None)
+    return (region, access_key, hashlib.sha256(secret_key.encode()).hexdigest())
+
+
+def _get_session(region: str, access_key: str = None, secret_key: str = None) -> boto3.Session:
+    """Return the shared session for a region and credential pair."""
+    key = _credentials_key(region, access_key, secret_key)
+    
+    def create():
+        if key[1] is not None:
+            return boto3.Session(
+                aws_access_key_id=access_key,
+                aws_secret_access_key=secret_key,
+                region_name=region
+            )
+        return boto3.Session(region_name=region)
+    
+    with _client_lock:
+        return _lru_get(_sessions, key, create, _SESSION_CACHE_SIZE)
+
+
+def _get_client(service: str, region: str, access_key: str = None, secret_key: str = None) -> Any:
+    """Return the shared client for a service, region and credential pair."""
+    session = _get_session(region, access_key, secret_key)
+    key = (service,) + _credentials_key(region, access_key, secret_key)
+    with _client_lock:
+        return _lru_get(_clients, key, lambda: session.client(service, config=_CLIENT_CONFIG), _CLIENT_CACHE_SIZE)
+
+
+# How long a cached response is served as fresh, in seconds, by how quickly the
+# underlying data changes. Entries are kept for STALE_TTL so the last good
+# response can still be served, flagged as stale, while the EKS API is failing.
+CACHE_TTL = {
+    'describe_cluster': 10,
+    'list_clusters': 30,
+    'create_cluster_plan': 60
+}
+STALE_TTL = 3600
+
+# Error codes that mean "try again later" rather than "the answer changed"
+_THROTTLING_CODES = frozenset({
+    'Throttling',
+    'ThrottlingException',
+    'TooManyRequestsException',
+    'RequestLimitExceeded'
+})
+
+
+def _is_transient(error: Exception) -> bool:
+    """True for connection failures, timeouts, throttling and 5xx server errors."""
+    if isinstance(error, (BotocoreConnectionError, HTTPClientError, TimeoutError)):
+        return True
+    if isinstance(error, ClientError):
+        if error.response.get('Error', {}).get('Code') in _THROTTLING_CODES:
+            return True
+        return error.response.get('ResponseMetadata', {}).get('HTTPStatusCode', 0) >= 500
+    return False
+
+
+# Responses live in Redis when the redis package is installed and REDIS_URL is
+# set, so several app processes share one cache; otherwise, or whenever Redis
+# is unreachable, they fall back to a per-process dict of
+# key -> (expires_at, payload), oldest first, capped at _LOCAL_CACHE_LIMIT.
+_redis_client = None
+if redis is not None and os.environ.get('REDIS_URL'):
+    _redis_client = redis.Redis.from_url(os.environ['REDIS_URL'], decode_responses=True, socket_timeout=0.2)
+_local_cache: 'OrderedDict[str, tuple]' = OrderedDict()
+_cache_lock = threading.Lock()
+_LOCAL_CACHE_LIMIT = 1024
+
+
+def _serialize(response: Dict[str, Any]) -> bytes:
+    """Encode a response as JSON, with orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(response, option=orjson.OPT_NAIVE_UTC, default=str)
+    return json.dumps(response, default=str).encode()
+
+
+def _deserialize(payload) -> Dict[str, Any]:
+    return orjson.loads(payload) if orjson is not None else json.loads(payload)
+
+
+def _cache_get(key: str) -> Optional[Dict[str, Any]]:
+    if _redis_client is not None:
+        try:
+            payload = _redis_client.get(key)
+        except redis.RedisError:
+            pass
+        else:
+            return _deserialize(payload) if payload else None
+    
+    with _cache_lock:
+        entry = _local_cache.get(key)
+    if entry is None or entry[0] < time.time():
+        return None
+    return _deserialize(entry[1])
+
+
+def _cache_set(key: str, value: Dict[str, Any], ttl: int):
+    payload = _serialize(value)
+    if _redis_client is not None:
+        try:
+            _redis_client.set(key, payload, ex=ttl)
+            return
+        except redis.RedisError:
+            pass
+    
+    with _cache_lock:
+        _local_cache[key] = (time.time() + ttl, payload)
+        _local_cache.move_to_end(key)
+        while len(_local_cache) > _LOCAL_CACHE_LIMIT:
+            _local_cache.popitem(last=False)
+
+
+def _cached_response(tier: str):
+    """
+    Cache a handler's successful responses for CACHE_TTL[tier] seconds.
+    
+    Keys are scoped by region and credentials. When the handler fails with a
+    transient error (see _is_transient) and an older response is still stored,
+    that response is returned instead with 'stale': True and the time it was
+    generated. Other errors, such as a deleted cluster, are returned as is.
+    """
+    ttl = CACHE_TTL[tier]
+    
+    def decorator(method):
+        signature = inspect.signature(method)
+        
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            # Bind first so positional and keyword calls share a cache entry
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            arguments = dict(list(bound.arguments.items())[1:])
+            args_digest = hashlib.sha256(json.dumps(arguments, sort_keys=True, default=str).encode()).hexdigest()[:16]
+            key = f"eks:{self.region}:{self._cache_scope}:{method.__name__}:{args_digest}"
+            
+            cached = _cache_get(key)
+            if cached is not None and time.time() - cached['generated_at'] < ttl:
+                return cached['body']
+            
+            response = method(*bound.args, **bound.kwargs)
+            if response.get('status') == 'success':
+                _cache_set(key, {'generated_at': time.time(), 'body': response}, STALE_TTL)
+            elif cached is not None and response.get('retryable'):
+                return {
+                    **cached['body'],
+                    'stale': True,
+                    'generated_at': cached['generated_at'],
+                    'error': response.get('message')
+                }
+            return response
+        
+        return wrapper
+    
+    return decorator
+
+
+# Routing keywords, one bit each, so a task is scanned once into a keyword mask
+B_LIST = 1 << 0
+B_DESC = 1 << 1
+B_CLUSTER = 1 << 2
+B_POD = 1 << 3
+B_DEPLOY = 1 << 4
+B_HEALTH = 1 << 5
+B_STATUS = 1 << 6
+B_CREATE = 1 << 7
+
+_ROUTE_KEYWORDS = {
+    'list': B_LIST,
+    'describe': B_DESC,
+    'cluster': B_CLUSTER,
+    'pod': B_POD,
+    'deployment': B_DEPLOY,
+    'health': B_HEALTH,
+    'status': B_STATUS,
+    'create': B_CREATE
+}
+
+_keyword_automaton = None
+if ahocorasick is not None:
+    _keyword_automaton = ahocorasick.Automaton()
+    for keyword, bit in _ROUTE_KEYWORDS.items():
+        _keyword_automaton.add_word(keyword, bit)
+    _keyword_automaton.make_automaton()
+
+# Without pyahocorasick, one alternation still finds every keyword in a single
+# pass. No word boundaries, so 'clusters' matches 'cluster' as the substring
+# checks this replaced did.
+_KEYWORD_PATTERN = re.compile('|'.join(_ROUTE_KEYWORDS))
+
+
+def _keyword_mask(task_lower: str) -> int:
+    """OR together the bits of every routing keyword found in the task."""
+    mask = 0
+    if _keyword_automaton is not None:
+        for _, bit in _keyword_automaton.iter(task_lower):
+            mask |= bit
+    else:
+        for keyword in _KEYWORD_PATTERN.findall(task_lower):
+            mask |= _ROUTE_KEYWORDS[keyword]
+    return mask
+
+
+# Keyword combinations -> handler name, in priority order: a task is routed to
+# the first entry whose keywords it contains all of
+_ROUTES = {
+    B_LIST | B_CLUSTER: 'list_clusters',
+    B_DESC | B_CLUSTER | B_HEALTH: 'describe_cluster_health',
+    B_DESC | B_CLUSTER: 'describe_cluster',
+    B_CREATE | B_CLUSTER: 'create_cluster_plan',
+    B_LIST | B_POD: 'list_workloads',
+    B_LIST | B_DEPLOY: 'list_workloads',
+    B_HEALTH: 'check_cluster_health',
+    B_STATUS: 'check_cluster_health'
+}
+
+
+def _route_task(task: str) -> Optional[str]:
+    """Map a natural language task to the name of the handler that serves it."""
+    mask = _keyword_mask(task.lower())
+    return next((route for keywords, route in _ROUTES.items() if mask & keywords == keywords), None)
+
+
+def _route_args(route: str, context: Dict[str, Any]) -> tuple:
+    """Positional arguments a routed handler takes from the task context."""
+    if route == 'list_clusters':
+        return ()
+    if route == 'create_cluster_plan':
+        return (context,)
+    return (context.get('cluster_name'),)
+
+
+def _unrecognized_task(task: str) -> Dict[str, Any]:
+    return {
+        'status': 'error',
+        'message': f'Task not recognized: {task}',
+        'suggestions': [
+            'List all EKS clusters',
+            'Describe cluster <name>',
+            'Check cluster health',
+            'List pods in cluster'
+        ]
+    }
+
+
+# Plan fields that don't depend on the request
+_PLAN_TEMPLATE = {
+    'kubernetes_version': '1.28',
+    'vpc_config': {
+        'create_new_vpc': True,
+        'nat_gateway': True
+    },
+    'estimated_time': '15-20 minutes'
+}
+
+
+@functools.lru_cache(maxsize=64)
+def _estimated_cost(node_count: int) -> str:
+    """Hourly cost of the control plane plus t3.medium-priced nodes."""
+    return f'~${0.10 + node_count * 0.04:.2f}/hour'
+
+
+async def _list_cluster_names(eks) -> List[str]:
+    """Every cluster name in the region, following pagination on an aioboto3 client."""
+    names = []
+    async for page in eks.get_paginator('list_clusters').paginate(PaginationConfig={'PageSize': 100}):
+        names.extend(page.get('clusters', []))
+    return names
+
+
+async def _describe_briefs(eks, names: List[str]) -> List[Dict[str, Any]]:
+    """
+    Describe clusters concurrently on an aioboto3 client, at most
+    DESCRIBE_CONCURRENCY at a time. A cluster whose describe fails (deleted
+    since listing, or no eks:DescribeCluster permission) is listed by name only.
+    """
+    semaphore = asyncio.Semaphore(DESCRIBE_CONCURRENCY)
+    
+    async def describe(name):
+        async with semaphore:
+            response = await eks.describe_cluster(name=name)
+        return _cluster_brief(response['cluster'])
+    
+    results = await asyncio.gather(*[describe(name) for name in names], return_exceptions=True)
+    return [
+        _cluster_brief({'name': name}) if isinstance(result, Exception) else result
+        for name, result in zip(names, results)
+    ]
+
+
+def _event_loop_running() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def _cluster_brief(cluster: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        'name': cluster['name'],
+        'status': cluster.get('status'),
+        'version': cluster.get('version')
+    }
+
+
+@functools.lru_cache(maxsize=256)
+def _format_timestamp(value: Any) -> str:
+    """ISO 8601 form of a boto3 timestamp; polling describes see the same few values."""
+    return value.isoformat() if hasattr(value, 'isoformat') else str(value)
+
+
+def _describe_response(cluster_name: str, cluster: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the describe_cluster response from a DescribeCluster 'cluster' payload."""
+    data = {
+        'name': cluster.get('name'),
+        'status': cluster.get('status'),
+        'version': cluster.get('version'),
+        'endpoint': cluster.get('endpoint'),
+        'created_at': _format_timestamp(cluster.get('createdAt')),
+        'platform_version': cluster.get('platformVersion'),
+        'vpc_config': cluster.get('resourcesVpcConfig', {})
+    }
+    return _success_response('describe_cluster', data, f'Cluster {cluster_name} is {cluster.get("status")}')
+
+
+def _health_response(cluster_name: str, cluster_info: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the check_cluster_health response from a describe_cluster response."""
+    if cluster_info['status'] != 'success':
+        return cluster_info
+    
+    cluster_data = cluster_info['data']
+    status = cluster_data.get('status')
+    
+    health = {
+        'cluster_name': cluster_name,
+        'status': status,
+        'healthy': status == 'ACTIVE',
+        'version': cluster_data.get('version'),
+        'endpoint_accessible': bool(cluster_data.get('endpoint'))
+    }
+    
+    # A stale describe makes for a stale health check
+    stale_fields = {key: cluster_info[key] for key in ('stale', 'generated_at', 'error') if key in cluster_info}
+    return _success_response(
+        'check_cluster_health',
+        health,
+        f'Cluster is {"healthy" if health["healthy"] else "not healthy"}',
+        **stale_fields
+    )
+
+
+# Fixed responses; handlers return copies so callers can't alter the originals
+_CLUSTER_NAME_REQUIRED = {
+    'status': 'error',
+    'message': 'Cluster name is required'
+}
+
+_PLAN_NEXT_STEPS = (
+    'Review the plan',
+    'Confirm to proceed with creation',
+    'Monitor creation progress'
+)
+
+
+def _success_response(task: str, data: Any, message: str, **extra: Any) -> Dict[str, Any]:
+    return {'status': 'success', 'task': task, 'data': data, 'message': message, **extra}
+
+
+def _error_response(task: str, error: Exception) -> Dict[str, Any]:
+    response = {
+        'status': 'error',
+        'task': task,
+        'message': str(error)
+    }
+    if _is_transient(error):
+        response['retryable'] = True
+    return response
+
+
+class _DescribeClusterBatcher:
+    """
+    Coalesce DescribeCluster calls that arrive close together.
+    
+    EKS has no multi-cluster describe, so a flush runs the distinct names
+    concurrently on a small pool; callers asking for the same cluster within
+    one window share a single request.
+    """
+    
+    def __init__(self, eks_client: Any, window: float = 0.02, max_batch: int = 50, max_workers: int = 10):
+        self._eks_client = eks_client
+        self._window = window
+        self._max_batch = max_batch
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='describe-cluster')
+        self._lock = threading.Lock()
+        self._pending: Dict[str, Future] = {}
+        self._timer: Optional[threading.Timer] = None
+    
+    def describe(self, cluster_name: str) -> Dict[str, Any]:
+        """Return the DescribeCluster 'cluster' payload, raising on API errors."""
+        return self.submit(cluster_name).result()
+    
+    def submit(self, cluster_name: str) -> Future:
+        with self._lock:
+            future = self._pending.get(cluster_name)
+            if future is None:
+                future = self._pending[cluster_name] = Future()
+                if len(self._pending) >= self._max_batch:
+                    self._flush_locked()
+                elif self._timer is None:
+                    self._timer = threading.Timer(self._window, self._flush)
+                    self._timer.daemon = True
+                    self._timer.start()
+            return future
+    
+    def _flush(self):
+        with self._lock:
+            self._flush_locked()
+    
+    def _flush_locked(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        
+        batch, self._pending = self._pending, {}
+        for cluster_name, future in batch.items():
+            self._executor.submit(self._resolve, cluster_name, future)
+    
+    def _resolve(self, cluster_name: str, future: Future):
+        try:
+            future.set_result(self._eks_client.describe_cluster(name=cluster_name)['cluster'])
+        except Exception as e:
+            future.set_exception(e)
 
 
 class StrandsEKSAgent:
@@ -12,22 +521,47 @@ class StrandsEKSAgent:
     Provides natural language interface to EKS cluster management.
     """
     
-    def __init__(self, region: str = 'us-west-2', access_key: str = None, secret_key: str = None):
-        self.region = region
+    def __init__(self, region: str = None, access_key: str = None, secret_key: str = None,
+                 eks_client: Any = None):
+        # Without an explicit region, use the one configured for the AWS SDK
+        region = region or boto3.Session().region_name
+        if not region:
+            raise ValueError('No AWS region given and none configured (set AWS_REGION or run aws configure)')
         
-        if access_key and secret_key:
-            self.session = boto3.Session(
-                aws_access_key_id=access_key,
-                aws_secret_access_key=secret_key,
-                region_name=region
-            )
-        else:
-            self.session = boto3.Session(region_name=region)
+        self.region = region
+        self.session = _get_session(region, access_key, secret_key)
+        self._credentials = (access_key, secret_key)
         
-        self.eks_client = self.session.client('eks')
-        self.ec2_client = self.session.client('ec2')
-        self.ecr_client = self.session.client('ecr')
+        # Callers with their own pooled/retrying client can share it
+        self.eks_client = eks_client or _get_client('eks', self.region, access_key, secret_key)
+        self._describer = _DescribeClusterBatcher(self.eks_client, max_workers=DESCRIBE_CONCURRENCY)
         
+    @functools.cached_property
+    def _cache_scope(self) -> str:
+        """
+        Digest of the secret key in use, so cached responses are only served to
+        callers holding the same credentials. Default credentials (profile,
+        role, environment) are resolved first so each identity gets its own scope.
+        """
+        access_key, secret_key = self._credentials
+        if not (access_key and secret_key):
+            credentials = self.session.get_credentials()
+            if credentials is None:
+                return 'anonymous'
+            frozen = credentials.get_frozen_credentials()
+            access_key, secret_key = frozen.access_key, frozen.secret_key
+        return _credentials_key(self.region, access_key, secret_key)[2][:32]
+    
+    # Most tasks only touch EKS, so the EC2 and ECR service models are loaded
+    # on first use rather than with every agent
+    @functools.cached_property
+    def ec2_client(self) -> Any:
+        return _get_client('ec2', self.region, *self._credentials)
+    
+    @functools.cached_property
+    def ecr_client(self) -> Any:
+        return _get_client('ecr', self.region, *self._credentials)
+    
     def execute_task(self, task: str, context: Dict[str, Any] = None) -> Dict[str, Any]:
         """
         Execute a task using natural language description.
@@ -39,88 +573,89 @@ class StrandsEKSAgent:
         Returns:
             Dict with status and results
         """
-        task_lower = task.lower()
-        context = context or {}
-        
-        # Route to appropriate handler
-        if 'list' in task_lower and 'cluster' in task_lower:
-            return self.list_clusters()
-        elif 'describe' in task_lower and 'cluster' in task_lower:
-            return self.describe_cluster(context.get('cluster_name'))
-        elif 'create' in task_lower and 'cluster' in task_lower:
-            return self.create_cluster_plan(context)
-        elif 'list' in task_lower and ('pod' in task_lower or 'deployment' in task_lower):
-            return self.list_workloads(context.get('cluster_name'))
-        elif 'health' in task_lower or 'status' in task_lower:
-            return self.check_cluster_health(context.get('cluster_name'))
-        else:
-            return {
-                'status': 'error',
-                'message': f'Task not recognized: {task}',
-                'suggestions': [
-                    'List all EKS clusters',
-                    'Describe cluster <name>',
-                    'Check cluster health',
-                    'List pods in cluster'
-                ]
-            }
+        route = _route_task(task)
+        if route is None:
+            return _unrecognized_task(task)
+        
+        return getattr(self, route)(*_route_args(route, context or {}))
     
+    @_cached_response('list_clusters')
     def list_clusters(self) -> Dict[str, Any]:
         """List all EKS clusters in the region."""
         try:
-            response = self.eks_client.list_clusters()
-            clusters = response.get('clusters', [])
+            data = {'region': self.region}
+            
+            # With aioboto3 the clusters are described concurrently, so their
+            # status comes back for about the cost of one round-trip. Callers
+            # already inside an event loop (notebooks, async hosts) can't
+            # asyncio.run, so they get the plain listing.
+            if aioboto3 is not None and not _event_loop_running():
+                details = asyncio.run(self._list_and_describe())
+                clusters = [detail['name'] for detail in details]
+                data['details'] = details
+            else:
+                clusters = list(self.iter_clusters())
             
-            return {
-                'status': 'success',
-                'task': 'list_clusters',
-                'data': {
-                    'clusters': clusters,
-                    'count': len(clusters),
-                    'region': self.region
-                },
-                'message': f'Found {len(clusters)} cluster(s) in {self.region}'
-            }
+            data.update(clusters=clusters, count=len(clusters))
+            return _success_response('list_clusters', data, f'Found {len(clusters)} cluster(s) in {self.region}')
         except Exception as e:
-            return {
-                'status': 'error',
-                'task': 'list_clusters',
-                'message': str(e)
-            }
+            return _error_response('list_clusters', e)
+    
+    @_cached_response('list_clusters')
+    def list_clusters_detailed(self) -> Dict[str, Any]:
+        """List all EKS clusters in the region with their status and version."""
+        try:
+            # Submitting every name before waiting lets the describes run
+            # concurrently, and overlap with fetching later pages
+            futures = {name: self._describer.submit(name) for name in self.iter_clusters()}
+            clusters = [self._brief_or_name(name, future) for name, future in futures.items()]
+            
+            return _success_response(
+                'list_clusters_detailed',
+                {'clusters': clusters, 'count': len(clusters), 'region': self.region},
+                f'Found {len(clusters)} cluster(s) in {self.region}'
+            )
+        except Exception as e:
+            return _error_response('list_clusters_detailed', e)
+    
+    @staticmethod
+    def _brief_or_name(cluster_name: str, future: Future) -> Dict[str, Any]:
+        """The cluster's brief, or its name alone if its describe failed."""
+        try:
+            return _cluster_brief(future.result())
+        except Exception:
+            return _cluster_brief({'name': cluster_name})
     
+    def iter_clusters(self) -> Iterator[str]:
+        """Yield the name of every cluster in the region, a page at a time."""
+        paginator = self.eks_client.get_paginator('list_clusters')
+        for page in paginator.paginate(PaginationConfig={'PageSize': 100}):
+            yield from page.get('clusters', [])
+    
+    async def _list_and_describe(self) -> List[Dict[str, Any]]:
+        """List clusters and describe them concurrently on a short-lived aioboto3 client."""
+        credentials = self.session.get_credentials().get_frozen_credentials()
+        session = aioboto3.Session(
+            aws_access_key_id=credentials.access_key,
+            aws_secret_access_key=credentials.secret_key,
+            aws_session_token=credentials.token,
+            region_name=self.region
+        )
+        async with session.client('eks', config=_CLIENT_CONFIG) as eks:
+            return await _describe_briefs(eks, await _list_cluster_names(eks))
+    
+    @_cached_response('describe_cluster')
     def describe_cluster(self, cluster_name: str) -> Dict[str, Any]:
         """Get detailed information about a specific cluster."""
         if not cluster_name:
-            return {
-                'status': 'error',
-                'message': 'Cluster name is required'
-            }
+            return dict(_CLUSTER_NAME_REQUIRED)
         
         try:
-            response = self.eks_client.describe_cluster(name=cluster_name)
-            cluster = response.get('cluster', {})
-            
-            return {
-                'status': 'success',
-                'task': 'describe_cluster',
-                'data': {
-                    'name': cluster.get('name'),
-                    'status': cluster.get('status'),
-                    'version': cluster.get('version'),
-                    'endpoint': cluster.get('endpoint'),
-                    'created_at': str(cluster.get('createdAt')),
-                    'platform_version': cluster.get('platformVersion'),
-                    'vpc_config': cluster.get('resourcesVpcConfig', {})
-                },
-                'message': f'Cluster {cluster_name} is {cluster.get("status")}'
-            }
+            return _describe_response(cluster_name, self._describer.describe(cluster_name))
         except Exception as e:
-            return {
-                'status': 'error',
-                'task': 'describe_cluster',
-                'message': str(e)
-            }
+            return _error_response('describe_cluster', e)
     
+    @_cached_response('create_cluster_plan')
     def create_cluster_plan(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """
         Generate a plan for creating an EKS cluster.
@@ -130,44 +665,30 @@ class StrandsEKSAgent:
         node_type = context.get('node_type', 't3.medium')
         node_count = context.get('node_count', 2)
         
-        plan = {
-            'cluster_name': cluster_name,
-            'region': self.region,
-            'kubernetes_version': '1.28',
-            'node_groups': [{
-                'name': f'{cluster_name}-nodes',
-                'instance_type': node_type,
-                'desired_capacity': node_count,
-                'min_size': 1,
-                'max_size': node_count + 2
-            }],
-            'vpc_config': {
-                'create_new_vpc': True,
-                'nat_gateway': True
-            },
-            'estimated_time': '15-20 minutes',
-            'estimated_cost': f'~${0.10 + (node_count * 0.04)}/hour'
-        }
+        plan = _PLAN_TEMPLATE.copy()
+        plan['vpc_config'] = _PLAN_TEMPLATE['vpc_config'].copy()
+        plan['cluster_name'] = cluster_name
+        plan['region'] = self.region
+        plan['node_groups'] = [{
+            'name': f'{cluster_name}-nodes',
+            'instance_type': node_type,
+            'desired_capacity': node_count,
+            'min_size': 1,
+            'max_size': node_count + 2
+        }]
+        plan['estimated_cost'] = _estimated_cost(node_count)
         
-        return {
-            'status': 'success',
-            'task': 'create_cluster_plan',
-            'data': plan,
-            'message': f'Cluster creation plan generated for {cluster_name}',
-            'next_steps': [
-                'Review the plan',
-                'Confirm to proceed with creation',
-                'Monitor creation progress'
-            ]
-        }
+        return _success_response(
+            'create_cluster_plan',
+            plan,
+            f'Cluster creation plan generated for {cluster_name}',
+            next_steps=list(_PLAN_NEXT_STEPS)
+        )
     
     def list_workloads(self, cluster_name: str) -> Dict[str, Any]:
         """List workloads (pods, deployments) in a cluster."""
         if not cluster_name:
-            return {
-                'status': 'error',
-                'message': 'Cluster name is required'
-            }
+            return dict(_CLUSTER_NAME_REQUIRED)
         
         return {
             'status': 'info',
@@ -179,43 +700,42 @@ class StrandsEKSAgent:
             ]
         }
     
-    def check_cluster_health(self, cluster_name: str) -> Dict[str, Any]:
-        """Check the health status of a cluster."""
+    def check_cluster_health(self, cluster_name: str, describe_result: Dict[str, Any] = None) -> Dict[str, Any]:
+        """
+        Check the health status of a cluster.
+        
+        Pass describe_result when the describe_cluster response is already at
+        hand to skip fetching it again.
+        """
         if not cluster_name:
-            return {
-                'status': 'error',
-                'message': 'Cluster name is required'
-            }
+            return dict(_CLUSTER_NAME_REQUIRED)
         
         try:
-            cluster_info = self.describe_cluster(cluster_name)
-            
-            if cluster_info['status'] != 'success':
-                return cluster_info
-            
-            cluster_data = cluster_info['data']
-            status = cluster_data.get('status')
-            
-            health = {
-                'cluster_name': cluster_name,
-                'status': status,
-                'healthy': status == 'ACTIVE',
-                'version': cluster_data.get('version'),
-                'endpoint_accessible': bool(cluster_data.get('endpoint'))
-            }
-            
-            return {
-                'status': 'success',
-                'task': 'check_cluster_health',
-                'data': health,
-                'message': f'Cluster is {"healthy" if health["healthy"] else "not healthy"}'
-            }
+            if describe_result is None:
+                describe_result = self.describe_cluster(cluster_name)
+            return _health_response(cluster_name, describe_result)
         except Exception as e:
-            return {
-                'status': 'error',
-                'task': 'check_cluster_health',
-                'message': str(e)
-            }
+            return _error_response('check_cluster_health', e)
+    
+    def describe_cluster_health(self, cluster_name: str) -> Dict[str, Any]:
+        """Describe a cluster and report its health from the same describe call."""
+        description = self.describe_cluster(cluster_name)
+        if description['status'] != 'success':
+            return description
+        
+        health = self.check_cluster_health(cluster_name, description)
+        return {**description, 'data': {**description['data'], 'health': health['data']}}
+    
+    def warmup(self):
+        """
+        Open a pooled connection to the EKS endpoint with a cheap call, so the
+        first real request doesn't pay for the TCP and TLS handshakes.
+        Failures are ignored; the request that follows will report them.
+        """
+        try:
+            self.eks_client.list_clusters(maxResults=1)
+        except Exception:
+            pass
     
     def get_available_tasks(self) -> List[str]:
         """Return list of available tasks this agent can perform."""
@@ -227,3 +747,152 @@ class StrandsEKSAgent:
             "List workloads in cluster",
             "Get cluster status"
         ]
+
+
+class AsyncStrandsEKSAgent:
+    """
+    Async counterpart of StrandsEKSAgent for callers that run an event loop.
+    
+    With aioboto3 installed, EKS calls go through long-lived async clients, one
+    per region, opened on first use and closed by aclose() (or `async with`).
+    Without it, the synchronous agent's calls run on worker threads instead.
+    """
+    
+    def __init__(self, region: str = None, access_key: str = None, secret_key: str = None):
+        self._agent = StrandsEKSAgent(region, access_key, secret_key)
+        self.region = self._agent.region
+        self._credentials = (access_key, secret_key)
+        self._client_stack: Optional[contextlib.AsyncExitStack] = None
+        self._eks: Dict[str, Any] = {}
+        self._client_lock = asyncio.Lock()
+    
+    async def __aenter__(self) -> 'AsyncStrandsEKSAgent':
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+    
+    async def aclose(self):
+        """Close the async EKS clients, if any were opened."""
+        if self._client_stack is not None:
+            await self._client_stack.aclose()
+            self._client_stack = None
+            self._eks = {}
+    
+    async def _eks_client(self, region: str = None) -> Any:
+        region = region or self.region
+        async with self._client_lock:
+            if region not in self._eks:
+                credentials = self._agent.session.get_credentials().get_frozen_credentials()
+                session = aioboto3.Session(
+                    aws_access_key_id=credentials.access_key,
+                    aws_secret_access_key=credentials.secret_key,
+                    aws_session_token=credentials.token,
+                    region_name=region
+                )
+                if self._client_stack is None:
+                    self._client_stack = contextlib.AsyncExitStack()
+                self._eks[region] = await self._client_stack.enter_async_context(session.client('eks', config=_CLIENT_CONFIG))
+            return self._eks[region]
+    
+    async def execute_task(self, task: str, context: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Async version of StrandsEKSAgent.execute_task."""
+        route = _route_task(task)
+        if route is None:
+            return _unrecognized_task(task)
+        
+        return await getattr(self, route)(*_route_args(route, context or {}))
+    
+    async def list_clusters(self) -> Dict[str, Any]:
+        """List all EKS clusters in the region, with status when aioboto3 is available."""
+        if aioboto3 is None:
+            return await asyncio.to_thread(self._agent.list_clusters)
+        
+        try:
+            eks = await self._eks_client()
+            clusters = await _list_cluster_names(eks)
+            details = await _describe_briefs(eks, clusters)
+            
+            return _success_response(
+                'list_clusters',
+                {'region': self.region, 'details': details, 'clusters': clusters, 'count': len(clusters)},
+                f'Found {len(clusters)} cluster(s) in {self.region}'
+            )
+        except Exception as e:
+            return _error_response('list_clusters', e)
+    
+    async def list_clusters_multi_region(self, regions: List[str]) -> Dict[str, Any]:
+        """
+        List cluster names across several regions concurrently.
+        
+        A region that fails is reported with its error instead of failing the
+        whole scan.
+        """
+        semaphore = asyncio.Semaphore(REGION_CONCURRENCY)
+        
+        def list_region_sync(region):
+            eks = _get_client('eks', region, *self._credentials)
+            paginator = eks.get_paginator('list_clusters')
+            return [name for page in paginator.paginate() for name in page.get('clusters', [])]
+        
+        async def list_region(region):
+            async with semaphore:
+                try:
+                    if aioboto3 is None:
+                        clusters = await asyncio.to_thread(list_region_sync, region)
+                    else:
+                        clusters = await _list_cluster_names(await self._eks_client(region))
+                except Exception as e:
+                    return region, {'error': str(e)}
+            return region, {'clusters': clusters, 'count': len(clusters)}
+        
+        results = dict(await asyncio.gather(*[list_region(region) for region in regions]))
+        total = sum(result.get('count', 0) for result in results.values())
+        
+        return _success_response(
+            'list_clusters_multi_region',
+            {'regions': results, 'count': total},
+            f'Found {total} cluster(s) across {len(regions)} region(s)'
+        )
+    
+    async def describe_cluster(self, cluster_name: str) -> Dict[str, Any]:
+        """Get detailed information about a specific cluster."""
+        if aioboto3 is None or not cluster_name:
+            return await asyncio.to_thread(self._agent.describe_cluster, cluster_name)
+        
+        try:
+            eks = await self._eks_client()
+            response = await eks.describe_cluster(name=cluster_name)
+            return _describe_response(cluster_name, response['cluster'])
+        except Exception as e:
+            return _error_response('describe_cluster', e)
+    
+    async def check_cluster_health(self, cluster_name: str, describe_result: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Check the health status of a cluster, reusing describe_result if given."""
+        if not cluster_name:
+            return self._agent.check_cluster_health(cluster_name)
+        
+        if describe_result is None:
+            describe_result = await self.describe_cluster(cluster_name)
+        return _health_response(cluster_name, describe_result)
+    
+    async def describe_cluster_health(self, cluster_name: str) -> Dict[str, Any]:
+        """Describe a cluster and report its health from the same describe call."""
+        description = await self.describe_cluster(cluster_name)
+        if description['status'] != 'success':
+            return description
+        
+        health = await self.check_cluster_health(cluster_name, description)
+        return {**description, 'data': {**description['data'], 'health': health['data']}}
+    
+    async def create_cluster_plan(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        """Generate a plan for creating an EKS cluster (no AWS calls)."""
+        return self._agent.create_cluster_plan(context)
+    
+    async def list_workloads(self, cluster_name: str) -> Dict[str, Any]:
+        """List workloads (pods, deployments) in a cluster (no AWS calls)."""
+        return self._agent.list_workloads(cluster_name)
+    
+    def get_available_tasks(self) -> List[str]:
+        """Return list of available tasks this agent can perform."""
+        return self._agent.get_available_tasks()
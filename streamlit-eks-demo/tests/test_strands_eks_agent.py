@@ -0,0 +1,64 @@
+import os
+import sys
+import time
+
+import pytest
+from botocore.exceptions import ClientError, EndpointConnectionError
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import strands_eks_agent  # noqa: E402
+from strands_eks_agent import StrandsEKSAgent  # noqa: E402
+
+
+class FakeEKS:
+    """Serves one cluster until it is told the endpoint went away."""
+    
+    def __init__(self):
+        self.error = None
+    
+    def describe_cluster(self, name):
+        if self.error is not None:
+            raise self.error
+        return {'cluster': {'name': name, 'status': 'ACTIVE', 'version': '1.28', 'endpoint': 'https://example'}}
+
+
+@pytest.fixture
+def agent():
+    strands_eks_agent._local_cache.clear()
+    return StrandsEKSAgent('us-east-1', 'AKIDEXAMPLE', 'secret', eks_client=FakeEKS())
+
+
+def test_describe_serves_stale_response_when_endpoint_unreachable(agent, monkeypatch):
+    fresh = agent.describe_cluster('demo')
+    assert fresh['status'] == 'success'
+    
+    later = time.time() + strands_eks_agent.CACHE_TTL['describe_cluster'] + 1
+    monkeypatch.setattr(strands_eks_agent.time, 'time', lambda: later)
+    agent.eks_client.error = EndpointConnectionError(endpoint_url='https://eks.us-east-1.amazonaws.com')
+    
+    response = agent.describe_cluster('demo')
+    
+    assert response['status'] == 'success'
+    assert response['stale'] is True
+    assert response['data'] == fresh['data']
+
+
+def test_list_clusters_detailed_keeps_clusters_whose_describe_fails(agent, monkeypatch):
+    monkeypatch.setattr(agent, 'iter_clusters', lambda: iter(['demo', 'gone']))
+    describe = agent.eks_client.describe_cluster
+    
+    def describe_cluster(name):
+        if name == 'gone':
+            raise ClientError({'Error': {'Code': 'ResourceNotFoundException'}}, 'DescribeCluster')
+        return describe(name)
+    
+    monkeypatch.setattr(agent.eks_client, 'describe_cluster', describe_cluster)
+    
+    response = agent.list_clusters_detailed()
+    
+    assert response['status'] == 'success'
+    assert response['data']['clusters'] == [
+        {'name': 'demo', 'status': 'ACTIVE', 'version': '1.28'},
+        {'name': 'gone', 'status': None, 'version': None}
+    ]